@@ -1,13 +1,44 @@
 """Flask application factory."""
 
+import os
+
+# Make socket/ssl/threading cooperative before anything imports them, so
+# gevent workers can overlap the blocking Kubernetes and SSH calls.
+# Opt-in via the entrypoint; plain `python run.py` stays unpatched.
+if os.getenv("GEVENT_MONKEY_PATCH", "false").lower() == "true":
+    from gevent import monkey
+
+    monkey.patch_all()
+
+import threading
+
 from flask import Flask
+from flask.json.provider import JSONProvider
 from flask_restx import Api
 
+try:
+    import orjson  # type: ignore
+except ModuleNotFoundError:
+    orjson = None
+
 from app.config.config import get_config
 from app.controllers.job_controller import api as jobs_api
 from app.controllers.nodes_controller import api as nodes_api
 from app.controllers.node_metadata_controller import api as node_metadata_api
-from app.services.job_watcher_service import job_watcher_service
+# Module import, not instance import: the watcher (and the repository,
+# Kubernetes and Prometheus singletons it binds) is built inside the
+# startup thread, not while this module is imported
+from app.services import job_watcher_service as job_watcher_service_module
+
+
+class OrjsonProvider(JSONProvider):
+    """JSON provider backed by orjson's C encoder."""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
 
 
 def create_app():
@@ -22,6 +53,11 @@ def create_app():
     app = Flask(__name__)
     app.config.from_object(config)
 
+    # Use orjson for response serialization when available; flask-restx
+    # picks up app.json for its marshalled output
+    if orjson:
+        app.json = OrjsonProvider(app)
+
     # Create API with Swagger documentation
     api = Api(
         app,
@@ -37,13 +73,44 @@ def create_app():
     api.add_namespace(nodes_api, path="/nodes")
     api.add_namespace(node_metadata_api, path="/node-metadata")
 
-    # Start job watcher on application startup
-    with app.app_context():
-        try:
-            job_watcher_service.start()
-            app.logger.info("Job watcher service started successfully")
-        except Exception as e:
-            app.logger.error(f"Failed to start job watcher: {e}")
+    # Render the Swagger schema once at startup so doc requests become a
+    # dict lookup instead of re-walking every api.model() definition.
+    # The cache lives for the process lifetime; a restart picks up changes.
+    with app.test_request_context():
+        api._cached_schema = api.__schema__
+
+    # Serialize the schema once too; doc requests then only copy bytes to
+    # the socket, the closest equivalent of serving a static asset
+    schema_body = app.json.dumps(api._cached_schema).encode()
+
+    @app.route("/api/v1/swagger.json")
+    def cached_swagger_json():
+        """Serve the pre-rendered OpenAPI schema."""
+        return app.response_class(
+            schema_body,
+            mimetype="application/json",
+            headers={"Cache-Control": "public, max-age=86400"},
+        )
+
+    # Start job watcher in the background so app boot (and /health) is not
+    # blocked by the initial Kubernetes sync. Under gunicorn every worker
+    # calls create_app(), so the watcher is gated to worker 0 (the index
+    # is assigned in gunicorn.conf.py); otherwise each worker would run
+    # its own watch streams, resync loop and node annotations against
+    # the same database. Plain `python run.py` has no WORKER_INDEX and
+    # keeps the watcher.
+    if os.getenv("WORKER_INDEX", "0") == "0":
+
+        def _start_job_watcher():
+            try:
+                job_watcher_service_module.job_watcher_service.start()
+                app.logger.info("Job watcher service started successfully")
+            except Exception as e:
+                app.logger.error(f"Failed to start job watcher: {e}")
+
+        threading.Thread(
+            target=_start_job_watcher, daemon=True, name="JobWatcherStartup"
+        ).start()
 
     # Health check endpoint
     @app.route("/")
@@ -56,4 +123,31 @@ def create_app():
             "version": config.API_VERSION,
         }
 
+    # Liveness/readiness probes hit the health endpoints many times per
+    # second, so answer them with a precomputed body before Flask routing
+    health_body = app.json.dumps(
+        {
+            "status": "healthy",
+            "service": config.API_TITLE,
+            "version": config.API_VERSION,
+        }
+    ).encode()
+    health_headers = [
+        ("Content-Type", "application/json"),
+        ("Content-Length", str(len(health_body))),
+    ]
+
+    flask_wsgi_app = app.wsgi_app
+
+    def health_short_circuit(environ, start_response):
+        if (
+            environ.get("PATH_INFO") in ("/", "/v1/health")
+            and environ.get("REQUEST_METHOD") == "GET"
+        ):
+            start_response("200 OK", health_headers)
+            return [health_body]
+        return flask_wsgi_app(environ, start_response)
+
+    app.wsgi_app = health_short_circuit
+
     return app
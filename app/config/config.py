@@ -2,6 +2,7 @@
 
 import os
 import logging
+from functools import lru_cache
 
 
 class Config:
@@ -14,6 +15,9 @@ class Config:
 
     # Kubernetes settings
     DEFAULT_NAMESPACE = os.getenv("DEFAULT_NAMESPACE", "prompts")
+    # Ceiling on pooled connections to the apiserver; raise when many
+    # concurrent requests block on connection checkout
+    K8S_CONNECTION_POOL_MAXSIZE = int(os.getenv("K8S_CONNECTION_POOL_MAXSIZE", "64"))
 
     # Database settings
     DATABASE_PATH = os.getenv("DATABASE_PATH", "/app/data/cluster.db")
@@ -21,9 +25,13 @@ class Config:
 
     # Prometheus settings
     PROMETHEUS_URL = os.getenv(
-        "PROMETHEUS_URL", 
+        "PROMETHEUS_URL",
         "http://prometheus.monitoring.svc.cluster.local:8000"
     )
+    # Optional pre-aggregated power metric (a Prometheus recording rule);
+    # when set, power lookups query it instead of avg_over_time over raw
+    # samples, which keeps long windows cheap on the Prometheus side
+    POWER_RECORDING_RULE = os.getenv("POWER_RECORDING_RULE")
 
     # Logging settings
     LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
@@ -41,10 +49,18 @@ class Config:
     def init_logging(cls):
         """Initialize logging configuration."""
         log_level = getattr(logging, cls.LOG_LEVEL, logging.INFO)
-        logging.basicConfig(
-            level=log_level,
-            format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        )
+        root = logging.getLogger()
+
+        # Build the formatter and handler once instead of going through
+        # basicConfig on every call
+        if not root.handlers:
+            handler = logging.StreamHandler()
+            handler.setFormatter(
+                logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+            )
+            root.addHandler(handler)
+
+        root.setLevel(log_level)
 
 
 class DevelopmentConfig(Config):
@@ -75,7 +91,12 @@ config = {
 }
 
 
+@lru_cache(maxsize=1)
 def get_config():
-    """Get configuration based on environment."""
+    """Get configuration based on environment.
+
+    Cached so every caller shares the same resolved config class instead
+    of re-reading FLASK_ENV on each call.
+    """
     env = os.getenv("FLASK_ENV", "default")
     return config.get(env, config["default"])
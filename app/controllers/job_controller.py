@@ -3,12 +3,20 @@
 import logging
 from flask import request
 from flask_restx import Namespace, Resource, fields
-from dataclasses import asdict
 
-from app.models.job import JobCreateRequest
-from app.services.kubernetes_service import kubernetes_service
+try:
+    import fastjsonschema  # type: ignore
+except ModuleNotFoundError:
+    fastjsonschema = None
+
+from app.models.job import JobCreateRequest, job_response_to_dict
+# Module import, not instance import: the kubernetes_service singleton
+# is built via module __getattr__, so importing the instance here would
+# trigger the kubeconfig load while the app is still importing (same
+# scheme as nodes_controller's shutdown_service). job_repository is
+# likewise deferred, via function-scope imports at its call sites.
+from app.services import kubernetes_service as kubernetes_service_module
 from app.services.job_status_service import job_status_service
-from app.repositories.job_repository import job_repository
 from app.config.config import get_config
 
 logger = logging.getLogger(__name__)
@@ -146,13 +154,32 @@ job_status_response_model = api.model(
 )
 
 
+# Shared parser for the optional ?namespace= query argument, built once
+# instead of re-reading request.args in every endpoint
+ns_parser = api.parser()
+ns_parser.add_argument(
+    "namespace",
+    type=str,
+    location="args",
+    default=config.DEFAULT_NAMESPACE,
+    help="Kubernetes namespace",
+)
+
+# Compile the create schema once at import; the generated validator is far
+# faster than flask-restx's per-request jsonschema interpretation. The
+# model itself is kept for Swagger documentation.
+_validate_job_create = (
+    fastjsonschema.compile(dict(job_create_model.__schema__)) if fastjsonschema else None
+)
+
+
 @api.route("/")
 class JobList(Resource):
     """Job list operations."""
 
     @api.doc("create_job")
-    @api.expect(job_create_model, validate=True)
-    @api.marshal_with(job_response_model, code=200)
+    @api.expect(job_create_model, validate=_validate_job_create is None)
+    @api.response(201, "Job created", job_response_model)
     @api.response(400, "Validation error", error_model)
     @api.response(500, "Internal server error", error_model)
     def post(self):
@@ -162,20 +189,27 @@ class JobList(Resource):
             if not data:
                 api.abort(400, error="Request body must be JSON")
 
+            if _validate_job_create:
+                try:
+                    _validate_job_create(data)
+                except fastjsonschema.JsonSchemaException as schema_err:
+                    # Surface through the ValueError handler below -> 400
+                    raise ValueError(str(schema_err)) from None
+
             job_request = JobCreateRequest(
                 prompt=data.get("prompt"),
                 n_predict=data.get("n_predict", 128),
                 temperature=data.get("temperature", 0.0),
             )
 
-            result = kubernetes_service.create_job(job_request)
-            return asdict(result), 201
+            result = kubernetes_service_module.kubernetes_service.create_job(job_request)
+            return job_response_to_dict(result), 201
 
         except ValueError as e:
-            logger.error(f"Validation error: {e}")
+            logger.error("Validation error: %s", e)
             api.abort(400, error=str(e))
         except Exception as e:
-            logger.error(f"Error creating job: {e}")
+            logger.error("Error creating job: %s", e)
             api.abort(500, error=str(e))
 
 
@@ -184,7 +218,8 @@ class JobStatusList(Resource):
     """Job status operations."""
 
     @api.doc("get_all_job_statuses")
-    @api.marshal_with(job_status_response_model, code=200)
+    @api.expect(ns_parser)
+    @api.response(200, "Success", job_status_response_model)
     @api.response(500, "Internal server error", error_model)
     def get(self):
         """
@@ -199,12 +234,12 @@ class JobStatusList(Resource):
         - **pending**: Job created but not yet scheduled
         """
         try:
-            namespace = request.args.get("namespace", config.DEFAULT_NAMESPACE)
+            namespace = ns_parser.parse_args()["namespace"]
             statuses = job_status_service.get_all_job_statuses(namespace)
             return {"jobs": statuses}, 200
 
         except Exception as e:
-            logger.error(f"Error getting job statuses: {e}")
+            logger.error("Error getting job statuses: %s", e)
             api.abort(500, error=str(e))
 
 
@@ -214,18 +249,19 @@ class JobLogs(Resource):
     """Job logs operations."""
 
     @api.doc("get_job_logs")
+    @api.expect(ns_parser)
     @api.marshal_with(job_logs_model, code=200)
     @api.response(404, "Job not found", error_model)
     @api.response(500, "Internal server error", error_model)
     def get(self, job_name):
         """Get logs/output from a Kubernetes job."""
         try:
-            namespace = request.args.get("namespace", config.DEFAULT_NAMESPACE)
-            result = kubernetes_service.get_job_logs(job_name, namespace)
+            namespace = ns_parser.parse_args()["namespace"]
+            result = kubernetes_service_module.kubernetes_service.get_job_logs(job_name, namespace)
             return result, 200
 
         except Exception as e:
-            logger.error(f"Error getting job logs: {e}")
+            logger.error("Error getting job logs: %s", e)
             if "not found" in str(e).lower():
                 api.abort(404, error=str(e))
             api.abort(500, error=str(e))
@@ -236,19 +272,25 @@ class JobHistory(Resource):
     """Job history operations."""
 
     @api.doc("get_job_history")
-    @api.marshal_list_with(job_history_model, code=200)
+    @api.response(200, "Success", [job_history_model])
     @api.response(500, "Internal server error", error_model)
     def get(self):
-        """Get historical job results from database."""
+        """Get historical job results from database.
+
+        Rows come out of the repository already shaped like
+        JobHistory, so they are returned verbatim instead of paying a
+        per-row, per-field marshalling pass on large pages.
+        """
         try:
             limit = request.args.get("limit", 100, type=int)
             offset = request.args.get("offset", 0, type=int)
 
+            from app.repositories.job_repository import job_repository
             results = job_repository.get_all_job_results(limit=limit, offset=offset)
             return results, 200
 
         except Exception as e:
-            logger.error(f"Error querying job history: {e}")
+            logger.error("Error querying job history: %s", e)
             api.abort(500, error=str(e))
 
 
@@ -258,13 +300,15 @@ class JobHistoryDetail(Resource):
     """Single job history operations."""
 
     @api.doc("get_job_result")
-    @api.marshal_with(job_history_model, code=200)
+    @api.expect(ns_parser)
+    @api.response(200, "Success", job_history_model)
     @api.response(404, "Job not found", error_model)
     @api.response(500, "Internal server error", error_model)
     def get(self, job_name):
         """Get stored result for a specific job."""
         try:
-            namespace = request.args.get("namespace", config.DEFAULT_NAMESPACE)
+            namespace = ns_parser.parse_args()["namespace"]
+            from app.repositories.job_repository import job_repository
             result = job_repository.get_job_result(job_name, namespace)
 
             if not result:
@@ -273,7 +317,7 @@ class JobHistoryDetail(Resource):
             return result, 200
 
         except Exception as e:
-            logger.error(f"Error querying job result: {e}")
+            logger.error("Error querying job result: %s", e)
             api.abort(500, error=str(e))
 
 
@@ -287,11 +331,12 @@ class JobStatistics(Resource):
     def get(self, node_name):
         """Get database statistics about job results."""
         try:
+            from app.repositories.job_repository import job_repository
             stats = job_repository.get_statistics(node_name)
             return stats, 200
 
         except Exception as e:
-            logger.error(f"Error querying job statistics: {e}")
+            logger.error("Error querying job statistics: %s", e)
             api.abort(500, error=str(e))
 
 
@@ -301,15 +346,17 @@ class JobHistoryDelete(Resource):
     """Delete specific job history."""
 
     @api.doc("delete_job_result")
+    @api.expect(ns_parser)
     @api.response(200, "Job result deleted successfully")
     @api.response(404, "Job not found", error_model)
     @api.response(500, "Internal server error", error_model)
     def delete(self, job_name):
         """Delete a specific job result from the database."""
         try:
-            namespace = request.args.get("namespace", config.DEFAULT_NAMESPACE)
+            namespace = ns_parser.parse_args()["namespace"]
 
             # Check if job exists
+            from app.repositories.job_repository import job_repository
             existing = job_repository.get_job_result(job_name, namespace)
             if not existing:
                 api.abort(
@@ -329,7 +376,7 @@ class JobHistoryDelete(Resource):
                 api.abort(500, error="Failed to delete job result")
 
         except Exception as e:
-            logger.error(f"Error deleting job result: {e}")
+            logger.error("Error deleting job result: %s", e)
             api.abort(500, error=str(e))
 
 
@@ -343,6 +390,7 @@ class JobHistoryClear(Resource):
     def delete(self):
         """Clear ALL job results from the database. Use with caution!"""
         try:
+            from app.repositories.job_repository import job_repository
             success, count = job_repository.clear_all_job_results()
 
             if success:
@@ -355,5 +403,5 @@ class JobHistoryClear(Resource):
                 api.abort(500, error="Failed to clear database")
 
         except Exception as e:
-            logger.error(f"Error clearing database: {e}")
+            logger.error("Error clearing database: %s", e)
             api.abort(500, error=str(e))
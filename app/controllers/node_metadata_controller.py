@@ -3,6 +3,7 @@
 from flask import request
 from flask_restx import Namespace, Resource, fields
 import logging
+import sqlite3
 
 from app.repositories.node_repository import node_repository
 
@@ -61,24 +62,18 @@ class NodeMetadataList(Resource):
             if not data.get('ip_address'):
                 api.abort(400, "ip_address is required")
             
-            # Check if node already exists
-            existing = node_repository.get_node_by_name(data['node_name'])
-            if existing:
-                api.abort(409, f"Node '{data['node_name']}' already exists")
-            
-            # Create node
-            node_repository.upsert_node(
+            # Create node; the UNIQUE constraint replaces a pre-check SELECT
+            node = node_repository.insert_node(
                 node_name=data['node_name'],
                 ip_address=data['ip_address'],
                 gpio_pin=data.get('gpio_pin'),
                 node_type=data.get('node_type', 'jetson'),
                 description=data.get('description')
             )
-            
-            # Return created node
-            node = node_repository.get_node_by_name(data['node_name'])
             return node, 201
-            
+
+        except sqlite3.IntegrityError:
+            api.abort(409, f"Node '{data['node_name']}' already exists")
         except Exception as e:
             logger.error("Failed to create node: %s", e)
             api.abort(500, f"Failed to create node: {str(e)}")
@@ -115,17 +110,15 @@ class NodeMetadata(Resource):
             if not existing:
                 api.abort(404, f"Node '{node_name}' not found")
             
-            # Update node (node_name from URL, other fields from body)
-            node_repository.upsert_node(
+            # Update node (node_name from URL, other fields from body);
+            # upsert_node returns the updated row, no second read needed
+            node = node_repository.upsert_node(
                 node_name=node_name,
                 ip_address=data.get('ip_address', existing['ip_address']),
                 gpio_pin=data.get('gpio_pin', existing.get('gpio_pin')),
                 node_type=data.get('node_type', existing.get('node_type', 'jetson')),
                 description=data.get('description', existing.get('description'))
             )
-            
-            # Return updated node
-            node = node_repository.get_node_by_name(node_name)
             return node, 200
             
         except Exception as e:
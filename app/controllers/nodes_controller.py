@@ -5,7 +5,10 @@ from flask_restx import Namespace, Resource, fields
 
 from app.config.config import get_config
 from app.services.gpio_service import gpio_service
-from app.services.shutdown_service import shutdown_service
+# Module import, not instance import: the service is built lazily on the
+# first shutdown request, so a missing SSH key mount doesn't break app
+# startup for deployments that never use the shutdown endpoint
+from app.services import shutdown_service as shutdown_service_module
 from app.services.node_service import node_service
 logger = logging.getLogger(__name__)
 config = get_config()
@@ -38,13 +41,13 @@ class NodeActivation(Resource):
             gpio_service.activate_pin(pin)
             return {'status': 'ok', 'pin': pin}
         except ValueError as err:
-            logger.error(f"Invalid GPIO request: {err}")
+            logger.error("Invalid GPIO request: %s", err)
             api.abort(400, error=str(err))
         except RuntimeError as err:
-            logger.error(f"GPIO unavailable: {err}")
+            logger.error("GPIO unavailable: %s", err)
             api.abort(503, error=str(err))
         except Exception as err:
-            logger.exception(f"Failed to activate GPIO pin {pin}: {err}")
+            logger.exception("Failed to activate GPIO pin %s: %s", pin, err)
             api.abort(500, error='Failed to activate GPIO pin')
 
 @api.route('/shutdown/<string:host>/<string:address>')
@@ -59,7 +62,9 @@ class NodeShutdown(Resource):
     def post(self, host: str, address: str):
         """Shutdown the server at the specified host."""
         try:
-            shutdown_service.shutdown(host_label=host, address=address)
+            shutdown_service_module.shutdown_service.shutdown(
+                host_label=host, address=address
+            )
             return {'status': 'ok', 'pin': None}
         except ValueError as err:
             logger.error("Invalid shutdown request: %s", err)
@@ -1,9 +1,17 @@
 """Data models for API requests and responses."""
 
-from dataclasses import dataclass, field
+import re
+import time
+import uuid
 
+from dataclasses import dataclass, field, fields
 
-@dataclass
+# RFC 1123 label shape required by Kubernetes for job names; compiled
+# once so per-request validation is a single match call
+_K8S_NAME_RE = re.compile(r"^[a-z0-9]([-a-z0-9]*[a-z0-9])?$")
+
+
+@dataclass(slots=True)
 class JobCreateRequest:
     """Model for job creation request."""
 
@@ -20,11 +28,9 @@ class JobCreateRequest:
         """Validate the request after initialization."""
         # Generate a unique job name if not provided
         if not self.name:
-            import uuid
-            import time
-
-            timestamp = int(time.time())
-            unique_id = str(uuid.uuid4())[:8]
+            # time_ns avoids the float round-trip of time.time()
+            timestamp = time.time_ns() // 1_000_000_000
+            unique_id = uuid.uuid4().hex[:8]
             self.name = f"llama-job-{timestamp}-{unique_id}"
 
         self.validate()
@@ -45,6 +51,11 @@ class JobCreateRequest:
             errors.append("namespace must be a non-empty string.")
         if not isinstance(self.name, str) or not self.name.strip():
             errors.append("name must be a non-empty string.")
+        elif len(self.name) > 63 or not _K8S_NAME_RE.match(self.name):
+            errors.append(
+                "name must be a valid Kubernetes name (lowercase alphanumeric "
+                "and '-', at most 63 characters)."
+            )
         if self.backoff_limit < 0:
             errors.append("backoff_limit must be non-negative.")
 
@@ -52,7 +63,7 @@ class JobCreateRequest:
             raise ValueError(f"Validation failed: {', '.join(errors)}")
 
 
-@dataclass
+@dataclass(slots=True)
 class JobResponse:
     """Model for job creation response."""
 
@@ -63,7 +74,7 @@ class JobResponse:
     creation_timestamp: str
 
 
-@dataclass
+@dataclass(slots=True)
 class JobStatusResponse:
     """Model for job status response."""
 
@@ -77,10 +88,26 @@ class JobStatusResponse:
     conditions: list = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class JobListResponse:
     """Model for job list response."""
 
     namespace: str
     jobs: list
     total: int
+
+
+# Field names captured once at import so serialization is a flat dict
+# build instead of dataclasses.asdict's reflective walk and deepcopy
+_JOB_RESPONSE_FIELDS = tuple(f.name for f in fields(JobResponse))
+_JOB_STATUS_RESPONSE_FIELDS = tuple(f.name for f in fields(JobStatusResponse))
+
+
+def job_response_to_dict(response: JobResponse) -> dict:
+    """Serialize a JobResponse to a plain dict."""
+    return {name: getattr(response, name) for name in _JOB_RESPONSE_FIELDS}
+
+
+def job_status_response_to_dict(response: JobStatusResponse) -> dict:
+    """Serialize a JobStatusResponse to a plain dict."""
+    return {name: getattr(response, name) for name in _JOB_STATUS_RESPONSE_FIELDS}
@@ -1,6 +1,21 @@
 """Repository layer for database access."""
 
-from app.repositories.job_repository import job_repository, JobRepository
 from app.repositories.node_repository import node_repository, NodeRepository
 
 __all__ = ['job_repository', 'JobRepository', 'node_repository', 'NodeRepository']
+
+
+def __getattr__(name):
+    # job_repository is re-exported lazily so importing the package does
+    # not trigger the database open in job_repository's own __getattr__.
+    # The result is cached in the package namespace, which also keeps the
+    # instance shadowing the submodule name as the eager import did.
+    if name == 'job_repository':
+        from app.repositories.job_repository import job_repository
+        globals()['job_repository'] = job_repository
+        return job_repository
+    if name == 'JobRepository':
+        from app.repositories.job_repository import JobRepository
+        globals()['JobRepository'] = JobRepository
+        return JobRepository
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,43 +1,166 @@
 """Repository for job results database operations."""
 
+import atexit
 import os
+import queue
 import sqlite3
 import logging
-from datetime import datetime
-from typing import List, Optional, Dict, Any
+import threading
+import time
+from typing import Iterator, List, Optional, Dict, Any
 from contextlib import contextmanager
 
 from app.config.config import get_config
 
 logger = logging.getLogger(__name__)
 
+# Single upsert for save_job_result, hoisted so SQLite's statement cache
+# can reuse the prepared statement. COALESCE keeps the None-means-don't-
+# overwrite semantics, and created_at survives updates untouched.
+_SAVE_JOB_RESULT_SQL = """
+    INSERT INTO job_results
+    (job_name, namespace, pod_name, node_name, status, prompt, result,
+     started_at, completed_at, duration_seconds, power_consumed_wh, token_count, error_message)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(job_name, namespace) DO UPDATE SET
+        pod_name = COALESCE(excluded.pod_name, job_results.pod_name),
+        node_name = COALESCE(excluded.node_name, job_results.node_name),
+        status = excluded.status,
+        prompt = COALESCE(excluded.prompt, job_results.prompt),
+        result = COALESCE(excluded.result, job_results.result),
+        started_at = COALESCE(excluded.started_at, job_results.started_at),
+        completed_at = COALESCE(excluded.completed_at, job_results.completed_at),
+        duration_seconds = COALESCE(excluded.duration_seconds, job_results.duration_seconds),
+        power_consumed_wh = COALESCE(excluded.power_consumed_wh, job_results.power_consumed_wh),
+        token_count = COALESCE(excluded.token_count, job_results.token_count),
+        error_message = COALESCE(excluded.error_message, job_results.error_message)
+"""
+
+
+# Read statements hoisted alongside the upsert for the same reason: the
+# strings are built once and sqlite3's statement cache sees a stable key.
+# The column tuple doubles as the key set when building row dicts, which
+# skips the per-row keys() walk of sqlite3.Row.
+_JOB_COLUMN_NAMES = (
+    "id", "job_name", "namespace", "pod_name", "node_name", "status",
+    "prompt", "result", "created_at", "started_at", "completed_at",
+    "duration_seconds", "power_consumed_wh", "token_count", "error_message",
+)
+_JOB_COLUMNS = ", ".join(_JOB_COLUMN_NAMES)
+
+_GET_JOB_RESULT_SQL = f"""
+    SELECT {_JOB_COLUMNS}
+    FROM job_results
+    WHERE job_name = ? AND namespace = ?
+"""
+
+_GET_ALL_JOB_RESULTS_SQL = f"""
+    SELECT {_JOB_COLUMNS}
+    FROM job_results
+    ORDER BY completed_at DESC
+    LIMIT ? OFFSET ?
+"""
+
+# Narrow projection for the polling sync: it only needs to know which
+# jobs are recorded and which completeness fields are still missing
+_GET_SYNC_STATE_SQL = """
+    SELECT job_name, node_name, started_at, completed_at, power_consumed_wh
+    FROM job_results
+    WHERE namespace = ?
+"""
+
+_GET_JOBS_BY_STATUS_SQL = f"""
+    SELECT {_JOB_COLUMNS}
+    FROM job_results
+    WHERE status = ?
+    ORDER BY completed_at DESC
+    LIMIT ?
+"""
+
 
 class JobRepository:
     """Repository for managing job results in SQLite."""
 
+    # Background writer tuning: a batch closes after this many records
+    # or once the window elapses, whichever comes first
+    _WRITE_BATCH_MAX = 100
+    _WRITE_BATCH_WINDOW_SECONDS = 0.05
+
     def __init__(self):
         self.config = get_config()
         self.db_path = getattr(self.config, "DATABASE_PATH", "/app/data/cluster.db")
         self.db_dir = getattr(self.config, "DATABASE_DIR", "/app/data")
+        # One long-lived connection per thread; opening per call reparses
+        # the schema and throws away SQLite's statement cache
+        self._local = threading.local()
+        self._connections = []
+        self._connections_lock = threading.Lock()
+        atexit.register(self._close_connections)
         self._init_database()
+        # Background writer for save_job_result_async; registered after
+        # _close_connections so the final flush runs before close
+        self._write_queue = queue.Queue()
+        threading.Thread(
+            target=self._writer_loop, daemon=True, name="JobRepositoryWriter"
+        ).start()
+        atexit.register(self.flush)
+
+    def _connect(self, timeout: float) -> sqlite3.Connection:
+        """Open and configure a new connection for the calling thread."""
+        # check_same_thread=False only so atexit can close connections
+        # owned by other threads; each connection is still used by a
+        # single thread via the thread-local
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=timeout,
+            check_same_thread=False,
+            cached_statements=256,
+        )
+        conn.row_factory = sqlite3.Row
+        # WAL mode is persistent (set once at init); these are
+        # per-connection settings
+        conn.execute("PRAGMA busy_timeout=5000")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-64000")
+        conn.execute("PRAGMA mmap_size=268435456")
+
+        with self._connections_lock:
+            self._connections.append(conn)
+        return conn
+
+    def _close_connections(self):
+        """Close every pooled connection at interpreter shutdown."""
+        with self._connections_lock:
+            for conn in self._connections:
+                try:
+                    conn.close()
+                except Exception:
+                    pass
+            self._connections.clear()
 
     @contextmanager
-    def _get_connection(self, timeout: float = 10.0):
-        """Context manager for database connections."""
-        conn = None
+    def _get_connection(self, timeout: float = 10.0, write: bool = False):
+        """Context manager yielding the calling thread's connection.
+
+        With write=True the transaction opens with BEGIN IMMEDIATE so the
+        write lock is taken up front instead of on a mid-transaction
+        upgrade, which is what produces SQLITE_BUSY under concurrency.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._connect(timeout)
+            self._local.conn = conn
+
         try:
-            conn = sqlite3.connect(self.db_path, timeout=timeout)
-            conn.row_factory = sqlite3.Row
+            if write:
+                conn.execute("BEGIN IMMEDIATE")
             yield conn
             conn.commit()
         except Exception as e:
-            if conn:
-                conn.rollback()
+            conn.rollback()
             logger.error(f"Database error: {e}")
             raise
-        finally:
-            if conn:
-                conn.close()
 
     def _init_database(self):
         """Initialize SQLite database schema."""
@@ -49,6 +172,11 @@ class JobRepository:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
 
+                # Write-ahead logging avoids an fsync per commit and lets
+                # readers proceed while the watcher writes; the setting is
+                # persistent so it only needs to run here
+                cursor.execute("PRAGMA journal_mode=WAL")
+
                 # Create main table
                 cursor.execute(
                     """
@@ -73,31 +201,23 @@ class JobRepository:
                 """
                 )
                 
-                # Add new columns if they don't exist (for existing databases)
-                try:
-                    cursor.execute("ALTER TABLE job_results ADD COLUMN node_name TEXT")
-                except sqlite3.OperationalError:
-                    pass  # Column already exists
-                    
-                try:
-                    cursor.execute("ALTER TABLE job_results ADD COLUMN started_at TIMESTAMP")
-                except sqlite3.OperationalError:
-                    pass
-                    
-                try:
-                    cursor.execute("ALTER TABLE job_results ADD COLUMN duration_seconds REAL")
-                except sqlite3.OperationalError:
-                    pass
-                    
-                try:
-                    cursor.execute("ALTER TABLE job_results ADD COLUMN power_consumed_wh REAL")
-                except sqlite3.OperationalError:
-                    pass
-                    
-                try:
-                    cursor.execute("ALTER TABLE job_results ADD COLUMN token_count INTEGER")
-                except sqlite3.OperationalError:
-                    pass
+                # Add new columns if they don't exist (for existing databases).
+                # One PRAGMA read tells us which are missing, so already
+                # migrated databases start up without speculative ALTERs
+                cursor.execute("PRAGMA table_info(job_results)")
+                existing_columns = {row[1] for row in cursor.fetchall()}
+
+                for column, column_type in (
+                    ("node_name", "TEXT"),
+                    ("started_at", "TIMESTAMP"),
+                    ("duration_seconds", "REAL"),
+                    ("power_consumed_wh", "REAL"),
+                    ("token_count", "INTEGER"),
+                ):
+                    if column not in existing_columns:
+                        cursor.execute(
+                            f"ALTER TABLE job_results ADD COLUMN {column} {column_type}"
+                        )
 
                 # Create indexes for faster queries
                 cursor.execute(
@@ -107,10 +227,26 @@ class JobRepository:
                 """
                 )
 
+                # Composite index lets get_jobs_by_status read rows in
+                # completed_at order straight off the B-tree instead of
+                # filtering then sorting; it also covers plain status
+                # lookups, so the old idx_job_status is redundant
                 cursor.execute(
                     """
-                    CREATE INDEX IF NOT EXISTS idx_job_status 
-                    ON job_results(status)
+                    CREATE INDEX IF NOT EXISTS idx_job_status_completed
+                    ON job_results(status, completed_at DESC)
+                """
+                )
+
+                cursor.execute("DROP INDEX IF EXISTS idx_job_status")
+
+                # Covering index for the per-node statistics and speed
+                # queries: COUNT/AVG over (token_count, duration_seconds)
+                # are answered from the index without touching the table
+                cursor.execute(
+                    """
+                    CREATE INDEX IF NOT EXISTS idx_stats_node
+                    ON job_results(node_name, token_count, duration_seconds)
                 """
                 )
 
@@ -172,76 +308,77 @@ class JobRepository:
             bool: True if save was successful
         """
         try:
-            with self._get_connection() as conn:
-                cursor = conn.cursor()
-                
-                # Check if job already exists to decide between INSERT and UPDATE
-                cursor.execute(
-                    "SELECT id, created_at FROM job_results WHERE job_name = ? AND namespace = ?",
-                    (job_name, namespace)
+            with self._get_connection(write=True) as conn:
+                conn.execute(
+                    _SAVE_JOB_RESULT_SQL,
+                    (
+                        job_name,
+                        namespace,
+                        pod_name,
+                        node_name,
+                        status,
+                        prompt,
+                        result,
+                        started_at,
+                        completed_at,
+                        duration_seconds,
+                        power_consumed_wh,
+                        token_count,
+                        error_message,
+                    ),
                 )
-                existing = cursor.fetchone()
-                
-                if existing:
-                    fields = {
-                        "status": status,
-                        "prompt": prompt,
-                        "result": result,
-                        "pod_name": pod_name,
-                        "node_name": node_name,
-                        "started_at": started_at,
-                        "completed_at": completed_at,
-                        "duration_seconds": duration_seconds,
-                        "power_consumed_wh": power_consumed_wh,
-                        "token_count": token_count,
-                        "error_message": error_message
-                    }
+                logger.info("Saved job %s with status %s", job_name, status)
 
-                    update_parts = []
-                    values = []
-                    for col, val in fields.items():
-                        if val is not None:
-                            update_parts.append(f"{col} = ?")
-                            values.append(val)
+            return True
 
-                    # Safety: if nothing to update (shouldn't happen because status is required), skip
-                    if update_parts:
-                        values.extend([job_name, namespace])
-                        cursor.execute(
-                            f"""
-                            UPDATE job_results
-                            SET {', '.join(update_parts)}
-                            WHERE job_name = ? AND namespace = ?
-                            """,
-                            values,
-                        )
-                    logger.info("Updated job %s with status %s", job_name, status)
-                else:
-                    # Insert new record
-                    cursor.execute(
-                        """
-                        INSERT INTO job_results 
-                        (job_name, namespace, pod_name, node_name, status, prompt, result, 
-                         started_at, completed_at, duration_seconds, power_consumed_wh, token_count, error_message)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        """,
-                        (
-                            job_name,
-                            namespace,
-                            pod_name,
-                            node_name,
-                            status,
-                            prompt,
-                            result,
-                            started_at,
-                            completed_at,
-                            duration_seconds,
-                            power_consumed_wh,
-                            token_count,
-                            error_message,
-                        ),
-                    )
-                    logger.info("Created job %s with status %s", job_name, status)
+        except sqlite3.OperationalError as e:
+            logger.error("Database locked or unavailable: %s", e)
+            return False
+        except Exception as e:
+            logger.error("Failed to save job result: %s", e)
+            return False
+
+    def save_job_results_many(self, records: List[Dict[str, Any]]) -> bool:
+        """
+        Save or update a batch of job results in one transaction.
+
+        Each record is a dict with the same keys as the save_job_result
+        arguments (job_name, namespace and status required, the rest
+        optional). A burst of status transitions then costs one upsert
+        statement and one commit instead of a transaction per job.
+
+        Args:
+            records: List of job result dicts
+
+        Returns:
+            bool: True if the batch was saved successfully
+        """
+        if not records:
+            return True
+
+        rows = [
+            (
+                record["job_name"],
+                record["namespace"],
+                record.get("pod_name"),
+                record.get("node_name"),
+                record["status"],
+                record.get("prompt"),
+                record.get("result"),
+                record.get("started_at"),
+                record.get("completed_at"),
+                record.get("duration_seconds"),
+                record.get("power_consumed_wh"),
+                record.get("token_count"),
+                record.get("error_message"),
+            )
+            for record in records
+        ]
+
+        try:
+            with self._get_connection(write=True) as conn:
+                conn.executemany(_SAVE_JOB_RESULT_SQL, rows)
+                logger.info("Saved %d job results in one batch", len(rows))
 
             return True
 
@@ -249,9 +386,52 @@ class JobRepository:
             logger.error("Database locked or unavailable: %s", e)
             return False
         except Exception as e:
-            logger.error("Failed to save job result: %s", e)
+            logger.error("Failed to save job results batch: %s", e)
             return False
 
+    def save_job_result_async(self, job_name: str, namespace: str, status: str, **fields):
+        """
+        Queue a job result for the background writer.
+
+        Enqueues the record and returns immediately; the writer thread
+        drains the queue every flush window and lands each batch through
+        save_job_results_many, so a burst of callers shares one fsync.
+        Use save_job_result when the caller needs read-after-write.
+
+        Args:
+            job_name: Name of the Kubernetes job
+            namespace: Kubernetes namespace
+            status: Job status
+            **fields: Any further save_job_result keyword arguments
+        """
+        record = {"job_name": job_name, "namespace": namespace, "status": status}
+        record.update(fields)
+        self._write_queue.put(record)
+
+    def flush(self):
+        """Block until every queued async write has been committed."""
+        self._write_queue.join()
+
+    def _writer_loop(self):
+        """Drain queued records into batched transactions."""
+        while True:
+            batch = [self._write_queue.get()]
+            deadline = time.monotonic() + self._WRITE_BATCH_WINDOW_SECONDS
+            while len(batch) < self._WRITE_BATCH_MAX:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._write_queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            try:
+                self.save_job_results_many(batch)
+            finally:
+                for _ in batch:
+                    self._write_queue.task_done()
+
     def get_job_result(self, job_name: str, namespace: str) -> Optional[Dict[str, Any]]:
         """
         Get a specific job result.
@@ -265,18 +445,7 @@ class JobRepository:
         """
         try:
             with self._get_connection() as conn:
-                cursor = conn.cursor()
-
-                cursor.execute(
-                    """
-                    SELECT id, job_name, namespace, pod_name, node_name, status, 
-                           prompt, result, created_at, started_at, completed_at, 
-                           duration_seconds, power_consumed_wh, token_count, error_message
-                    FROM job_results
-                    WHERE job_name = ? AND namespace = ?
-                """,
-                    (job_name, namespace),
-                )
+                cursor = conn.execute(_GET_JOB_RESULT_SQL, (job_name, namespace))
 
                 row = cursor.fetchone()
                 if row:
@@ -287,40 +456,84 @@ class JobRepository:
             logger.error("Error fetching job result: %s", e)
             return None
 
-    def get_all_job_results(
+    def get_job_sync_state(self, namespace: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the completeness fields for every recorded job in a namespace.
+
+        One query replaces the per-job get_job_result lookups the polling
+        sync used to issue, and the narrow projection keeps large prompt
+        and result blobs out of the transfer.
+
+        Args:
+            namespace: Kubernetes namespace
+
+        Returns:
+            Dict mapping job_name to its node_name, started_at,
+            completed_at and power_consumed_wh values
+        """
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.execute(_GET_SYNC_STATE_SQL, (namespace,))
+                return {
+                    row[0]: {
+                        "node_name": row[1],
+                        "started_at": row[2],
+                        "completed_at": row[3],
+                        "power_consumed_wh": row[4],
+                    }
+                    for row in cursor.fetchall()
+                }
+
+        except Exception as e:
+            logger.error("Error fetching job sync state: %s", e)
+            return {}
+
+    def get_all_job_results_iter(
         self, limit: int = 100, offset: int = 0
-    ) -> List[Dict[str, Any]]:
+    ) -> Iterator[Dict[str, Any]]:
         """
-        Get all job results with pagination.
+        Iterate over job results with pagination.
+
+        Yields rows one at a time so large pages don't materialize a full
+        list in memory; the cursor fetches in batches under the hood.
 
         Args:
             limit: Maximum number of results to return
             offset: Number of results to skip
 
-        Returns:
-            List of job result dictionaries
+        Yields:
+            Job result dictionaries
         """
         try:
             with self._get_connection() as conn:
-                cursor = conn.cursor()
-
-                cursor.execute(
-                    """
-                    SELECT id, job_name, namespace, pod_name, node_name, status, 
-                           prompt, result, created_at, started_at, completed_at, 
-                           duration_seconds, power_consumed_wh, token_count, error_message
-                    FROM job_results
-                    ORDER BY completed_at DESC
-                    LIMIT ? OFFSET ?
-                """,
-                    (limit, offset),
-                )
+                cursor = conn.execute(_GET_ALL_JOB_RESULTS_SQL, (limit, offset))
 
-                return [dict(row) for row in cursor.fetchall()]
+                # fetchmany pulls rows in blocks so the C layer is entered
+                # once per batch rather than once per row
+                while True:
+                    batch = cursor.fetchmany(256)
+                    if not batch:
+                        break
+                    for row in batch:
+                        yield dict(zip(_JOB_COLUMN_NAMES, row))
 
         except Exception as e:
             logger.error("Error fetching all job results: %s", e)
-            return []
+
+    def get_all_job_results(
+        self, limit: int = 100, offset: int = 0
+    ) -> List[Dict[str, Any]]:
+        """
+        Get all job results with pagination.
+
+        Args:
+            limit: Maximum number of results to return
+            offset: Number of results to skip
+
+        Returns:
+            List of job result dictionaries
+        """
+        return list(self.get_all_job_results_iter(limit=limit, offset=offset))
 
     def get_jobs_by_status(self, status: str, limit: int = 100) -> List[Dict[str, Any]]:
         """
@@ -335,22 +548,9 @@ class JobRepository:
         """
         try:
             with self._get_connection() as conn:
-                cursor = conn.cursor()
+                cursor = conn.execute(_GET_JOBS_BY_STATUS_SQL, (status, limit))
 
-                cursor.execute(
-                    """
-                    SELECT id, job_name, namespace, pod_name, node_name, status, 
-                           prompt, result, created_at, started_at, completed_at, 
-                           duration_seconds, power_consumed_wh, error_message
-                    FROM job_results
-                    WHERE status = ?
-                    ORDER BY completed_at DESC
-                    LIMIT ?
-                """,
-                    (status, limit),
-                )
-
-                return [dict(row) for row in cursor.fetchall()]
+                return [dict(zip(_JOB_COLUMN_NAMES, row)) for row in cursor.fetchall()]
 
         except Exception as e:
             logger.error("Error fetching jobs by status: %s", e)
@@ -368,10 +568,8 @@ class JobRepository:
             bool: True if deletion was successful
         """
         try:
-            with self._get_connection() as conn:
-                cursor = conn.cursor()
-
-                cursor.execute(
+            with self._get_connection(write=True) as conn:
+                cursor = conn.execute(
                     """
                     DELETE FROM job_results
                     WHERE job_name = ? AND namespace = ?
@@ -394,18 +592,14 @@ class JobRepository:
             tuple: (success: bool, count: int) - Success status and number of records deleted
         """
         try:
-            with self._get_connection() as conn:
-                cursor = conn.cursor()
-
-                # Get count before deletion
-                cursor.execute("SELECT COUNT(*) FROM job_results")
-                count = cursor.fetchone()[0]
-
-                # Delete all records
-                cursor.execute("DELETE FROM job_results")
+            with self._get_connection(write=True) as conn:
+                # An unqualified DELETE takes SQLite's truncate fast path;
+                # rowcount reports what it removed, so no pre-count scan
+                cursor = conn.execute("DELETE FROM job_results")
+                count = cursor.rowcount
 
                 # Reset auto-increment counter
-                cursor.execute(
+                conn.execute(
                     'DELETE FROM sqlite_sequence WHERE name="job_results"'
                 )
 
@@ -427,9 +621,7 @@ class JobRepository:
         """
         try:
             with self._get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute("SELECT COUNT(*) FROM job_results")
-                return cursor.fetchone()[0]
+                return conn.execute("SELECT COUNT(*) FROM job_results").fetchone()[0]
 
         except Exception as e:
             logger.error("Error getting job count: %s", e)
@@ -444,30 +636,28 @@ class JobRepository:
         """
         try:
             with self._get_connection() as conn:
-                cursor = conn.cursor()
-
-                # Total count of jobs for this node
-                cursor.execute("SELECT COUNT(*) FROM job_results WHERE node_name = ?", (node_name,))
-                total = cursor.fetchone()[0]
-
-                # Calculate average time per token using the token_count field
-                cursor.execute(
+                # Both aggregates come from one scan of the node's rows;
+                # the CASE keeps the average restricted to usable samples
+                cursor = conn.execute(
                     """
-                    SELECT AVG(duration_seconds / token_count) as avg_seconds_per_token
+                    SELECT
+                        COUNT(*) as total_jobs,
+                        AVG(
+                            CASE
+                                WHEN token_count > 0 AND duration_seconds IS NOT NULL
+                                THEN duration_seconds / token_count
+                            END
+                        ) as avg_seconds_per_token
                     FROM job_results
-                    WHERE node_name = ? 
-                    AND token_count IS NOT NULL 
-                    AND duration_seconds IS NOT NULL
-                    AND token_count > 0
+                    WHERE node_name = ?
                 """,
                     (node_name,),
                 )
                 row = cursor.fetchone()
-                avg_seconds_per_token = row[0] if row and row[0] is not None else 0
 
                 return {
-                    "total_jobs": total,
-                    "avg_seconds_per_token": avg_seconds_per_token,
+                    "total_jobs": row[0] if row else 0,
+                    "avg_seconds_per_token": row[1] if row and row[1] is not None else 0,
                 }
 
         except Exception as e:
@@ -483,10 +673,8 @@ class JobRepository:
         """
         try:
             with self._get_connection() as conn:
-                cursor = conn.cursor()
-                
-                # Calculate average tokens per second from completed jobs
-                cursor.execute(
+                                # Calculate average tokens per second from completed jobs
+                cursor = conn.execute(
                     """
                     SELECT AVG(token_count / duration_seconds) as tokens_per_second
                     FROM job_results
@@ -518,10 +706,8 @@ class JobRepository:
         """
         try:
             with self._get_connection() as conn:
-                cursor = conn.cursor()
-                
-                # Calculate average tokens per second for each node
-                cursor.execute(
+                                # Calculate average tokens per second for each node
+                cursor = conn.execute(
                     """
                     SELECT node_name, AVG(token_count / duration_seconds) as tokens_per_second
                     FROM job_results
@@ -548,5 +734,15 @@ class JobRepository:
             return {}
 
 
-# Global repository instance
-job_repository = JobRepository()
+# Global repository instance, created on first access (PEP 562) so merely
+# importing this module does not open the database or run the schema DDL
+_job_repository: Optional[JobRepository] = None
+
+
+def __getattr__(name: str):
+    global _job_repository
+    if name == "job_repository":
+        if _job_repository is None:
+            _job_repository = JobRepository()
+        return _job_repository
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,118 +1,296 @@
+import atexit
 import sqlite3
+import threading
+import time
+from contextlib import contextmanager
 from typing import Optional, List, Dict
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Explicit column list (rather than SELECT *) keeps the row shape stable
+# and lets the planner satisfy reads from a covering index if one fits
+_NODE_COLUMNS = "id, node_name, ip_address, gpio_pin, node_type, description, created_at, updated_at"
+
+_GET_NODE_SQL = f"SELECT {_NODE_COLUMNS} FROM nodes WHERE node_name = ?"
+
+_GET_ALL_NODES_SQL = f"SELECT {_NODE_COLUMNS} FROM nodes ORDER BY node_name"
+
+_INSERT_NODE_SQL = """
+    INSERT INTO nodes (node_name, ip_address, gpio_pin, node_type, description, updated_at)
+    VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+    RETURNING *
+"""
+
+_UPSERT_NODE_SQL = """
+    INSERT INTO nodes (node_name, ip_address, gpio_pin, node_type, description, updated_at)
+    VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+    ON CONFLICT(node_name) DO UPDATE SET
+        ip_address = excluded.ip_address,
+        gpio_pin = excluded.gpio_pin,
+        node_type = excluded.node_type,
+        description = excluded.description,
+        updated_at = CURRENT_TIMESTAMP
+"""
+
+_UPSERT_NODE_RETURNING_SQL = _UPSERT_NODE_SQL.rstrip() + "\n    RETURNING *\n"
+
+_DELETE_NODE_SQL = "DELETE FROM nodes WHERE node_name = ?"
+
 
 class NodeRepository:
     """Repository for managing cluster node metadata."""
-    
+
+    # Write-through invalidation only reaches the process that handled
+    # the write, and gunicorn runs several workers against the shared
+    # database; the TTL bounds how long the other workers can serve a
+    # stale row after a node is created, updated or deleted elsewhere
+    _CACHE_TTL_SECONDS = 60.0
+
     def __init__(self, db_path: str = '/app/data/cluster.db'):
         self.db_path = db_path
+        # Node metadata changes rarely but is read on every GPIO/power
+        # lookup, so cache rows in-process as (expires_at, row) and
+        # invalidate on writes; see _CACHE_TTL_SECONDS for the bound
+        self._node_cache: Dict[str, tuple] = {}
+        self._all_nodes_cache: Optional[tuple] = None
+        # One long-lived connection per thread, same scheme as
+        # JobRepository: per-call connect/close discards SQLite's
+        # statement cache and pays a file open per query
+        self._local = threading.local()
+        self._connections = []
+        self._connections_lock = threading.Lock()
+        atexit.register(self._close_connections)
         self._init_db()
-    
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open and configure a new connection for the calling thread."""
+        conn = sqlite3.connect(
+            self.db_path, check_same_thread=False, cached_statements=256
+        )
+        conn.row_factory = sqlite3.Row
+        # WAL itself persists in the database header (JobRepository sets
+        # it on the shared file); the rest are per-connection settings
+        conn.execute("PRAGMA busy_timeout=5000")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-64000")
+        conn.execute("PRAGMA mmap_size=268435456")
+
+        with self._connections_lock:
+            self._connections.append(conn)
+        return conn
+
+    def _close_connections(self):
+        """Close every pooled connection at interpreter shutdown."""
+        with self._connections_lock:
+            for conn in self._connections:
+                try:
+                    conn.close()
+                except Exception:
+                    pass
+            self._connections.clear()
+
+    @contextmanager
+    def _get_connection(self):
+        """Context manager yielding the calling thread's connection."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._connect()
+            self._local.conn = conn
+
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
     def _init_db(self):
         """Initialize the nodes table."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Create nodes table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS nodes (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                node_name TEXT NOT NULL UNIQUE,
-                ip_address TEXT NOT NULL,
-                gpio_pin INTEGER,
-                node_type TEXT DEFAULT 'jetson',
-                description TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        with self._get_connection() as conn:
+            # Persistent setting; harmless no-op when JobRepository has
+            # already switched the shared database file over
+            conn.execute("PRAGMA journal_mode=WAL")
+
+            # Create nodes table
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS nodes (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    node_name TEXT NOT NULL UNIQUE,
+                    ip_address TEXT NOT NULL,
+                    gpio_pin INTEGER,
+                    node_type TEXT DEFAULT 'jetson',
+                    description TEXT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+
+    def _store_in_all_cache(self, node: Dict) -> None:
+        """Write-through a single row into the cached node list."""
+        cached = self._all_nodes_cache
+        if cached is None:
+            return
+        expires_at, nodes = cached
+        if time.monotonic() >= expires_at:
+            self._all_nodes_cache = None
+            return
+
+        name = node["node_name"]
+        for i, existing in enumerate(nodes):
+            if existing["node_name"] == name:
+                nodes[i] = dict(node)
+                return
+
+        nodes.append(dict(node))
+        nodes.sort(key=lambda entry: entry["node_name"])
+
+    def _remove_from_all_cache(self, node_name: str) -> None:
+        """Drop a single row from the cached node list."""
+        cached = self._all_nodes_cache
+        if cached is not None:
+            expires_at, nodes = cached
+            self._all_nodes_cache = (
+                expires_at,
+                [entry for entry in nodes if entry["node_name"] != node_name],
             )
-        ''')
-        
-        conn.commit()
-        conn.close()
-    
+
     def get_node_by_name(self, node_name: str) -> Optional[Dict]:
         """Get node information by node name."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        
-        cursor.execute(
-            'SELECT * FROM nodes WHERE node_name = ?',
-            (node_name,)
-        )
-        row = cursor.fetchone()
-        conn.close()
-        
+        cached = self._node_cache.get(node_name)
+        if cached is not None and time.monotonic() < cached[0]:
+            return dict(cached[1])
+
+        with self._get_connection() as conn:
+            row = conn.execute(_GET_NODE_SQL, (node_name,)).fetchone()
+
         if row:
-            return dict(row)
+            node = dict(row)
+            self._node_cache[node_name] = (
+                time.monotonic() + self._CACHE_TTL_SECONDS, node
+            )
+            return dict(node)
+        self._node_cache.pop(node_name, None)
         return None
-    
+
     def get_all_nodes(self) -> List[Dict]:
         """Get all nodes."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        
-        cursor.execute('SELECT * FROM nodes ORDER BY node_name')
-        rows = cursor.fetchall()
-        conn.close()
-        
-        return [dict(row) for row in rows]
-    
-    def upsert_node(self, node_name: str, ip_address: str, gpio_pin: Optional[int] = None, 
-                    node_type: str = 'jetson', description: Optional[str] = None) -> None:
-        """Insert or update a node."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
+        cached = self._all_nodes_cache
+        if cached is not None and time.monotonic() < cached[0]:
+            return [dict(node) for node in cached[1]]
+
+        with self._get_connection() as conn:
+            rows = conn.execute(_GET_ALL_NODES_SQL).fetchall()
+
+        nodes = [dict(row) for row in rows]
+        self._all_nodes_cache = (time.monotonic() + self._CACHE_TTL_SECONDS, nodes)
+        return [dict(node) for node in nodes]
+
+    def insert_node(self, node_name: str, ip_address: str, gpio_pin: Optional[int] = None,
+                    node_type: str = 'jetson', description: Optional[str] = None) -> Dict:
+        """Insert a new node and return the created row.
+
+        Raises sqlite3.IntegrityError if the node name already exists, so
+        callers can map duplicates to a 409 without a pre-check SELECT.
+        """
         try:
-            cursor.execute('''
-                INSERT INTO nodes (node_name, ip_address, gpio_pin, node_type, description, updated_at)
-                VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-                ON CONFLICT(node_name) DO UPDATE SET
-                    ip_address = excluded.ip_address,
-                    gpio_pin = excluded.gpio_pin,
-                    node_type = excluded.node_type,
-                    description = excluded.description,
-                    updated_at = CURRENT_TIMESTAMP
-            ''', (node_name, ip_address, gpio_pin, node_type, description))
-            
-            conn.commit()
+            with self._get_connection() as conn:
+                row = conn.execute(
+                    _INSERT_NODE_SQL,
+                    (node_name, ip_address, gpio_pin, node_type, description),
+                ).fetchone()
+
+            logger.info("Inserted node: %s (%s)", node_name, ip_address)
+            node = dict(row)
+            self._node_cache[node_name] = (
+                time.monotonic() + self._CACHE_TTL_SECONDS, dict(node)
+            )
+            self._store_in_all_cache(node)
+            return node
+        except Exception as e:
+            logger.error("Failed to insert node %s: %s", node_name, e)
+            raise
+
+    def upsert_node(self, node_name: str, ip_address: str, gpio_pin: Optional[int] = None,
+                    node_type: str = 'jetson', description: Optional[str] = None) -> Dict:
+        """Insert or update a node and return the resulting row.
+
+        RETURNING lets a single round-trip both write and read the row, so
+        callers no longer need a follow-up get_node_by_name.
+        """
+        try:
+            with self._get_connection() as conn:
+                row = conn.execute(
+                    _UPSERT_NODE_RETURNING_SQL,
+                    (node_name, ip_address, gpio_pin, node_type, description),
+                ).fetchone()
+
             logger.info("Upserted node: %s (%s)", node_name, ip_address)
+            node = dict(row)
+            self._node_cache[node_name] = (
+                time.monotonic() + self._CACHE_TTL_SECONDS, dict(node)
+            )
+            self._store_in_all_cache(node)
+            return node
         except Exception as e:
             logger.error("Failed to upsert node %s: %s", node_name, e)
+            raise
 
-            conn.rollback()
+    def upsert_nodes(self, nodes: List[Dict]) -> bool:
+        """Insert or update a batch of nodes in one transaction.
+
+        Each dict carries the upsert_node arguments (node_name and
+        ip_address required; gpio_pin, node_type, description optional).
+        A cluster-wide registration then costs one commit instead of one
+        per node.
+        """
+        if not nodes:
+            return True
+
+        rows = [
+            (
+                node["node_name"],
+                node["ip_address"],
+                node.get("gpio_pin"),
+                node.get("node_type", "jetson"),
+                node.get("description"),
+            )
+            for node in nodes
+        ]
+
+        try:
+            with self._get_connection() as conn:
+                conn.executemany(_UPSERT_NODE_SQL, rows)
+
+            logger.info("Upserted %d nodes in one batch", len(rows))
+            # The batch bypasses RETURNING, so refresh lazily
+            self._node_cache.clear()
+            self._all_nodes_cache = None
+            return True
+        except Exception as e:
+            logger.error("Failed to upsert node batch: %s", e)
             raise
-        finally:
-            conn.close()
-    
+
     def delete_node(self, node_name: str) -> bool:
         """Delete a node by name."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
         try:
-            cursor.execute('DELETE FROM nodes WHERE node_name = ?', (node_name,))
-            conn.commit()
-            deleted = cursor.rowcount > 0
-            
+            with self._get_connection() as conn:
+                cursor = conn.execute(_DELETE_NODE_SQL, (node_name,))
+                deleted = cursor.rowcount > 0
+
+            self._node_cache.pop(node_name, None)
+            self._remove_from_all_cache(node_name)
+
             if deleted:
                 logger.info("Deleted node: %s", node_name)
             else:
                 logger.warning("Node not found for deletion: %s", node_name)
-            
+
             return deleted
         except Exception as e:
             logger.error("Failed to delete node %s: %s", node_name, e)
-            conn.rollback()
             raise
-        finally:
-            conn.close()
 
 
 # Global instance
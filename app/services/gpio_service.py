@@ -1,8 +1,9 @@
 """Service layer for interacting with Raspberry Pi GPIO pins."""
 import logging
+import queue
 import time
-from threading import Lock
-from typing import Optional, Protocol
+from threading import Event, Lock, Thread
+from typing import List, Optional, Protocol, Tuple
 
 try:
     import lgpio  # type: ignore
@@ -20,6 +21,9 @@ class GPIOBackend(Protocol):
     def setup_pin(self, pin: int) -> None:
         """Prepare a pin for output operations."""
 
+    def write_pin(self, pin: int, high: bool) -> None:
+        """Drive a pin high or low."""
+
     def pulse_pin(self, pin: int, pulse_seconds: float) -> None:
         """Drive a pin high for a short duration before returning it low."""
 
@@ -35,6 +39,15 @@ class LGPIOBackend:
         except OSError as err:
             raise RuntimeError(f"Failed to open /dev/gpiochip0: {err}") from err
         self._initialized = set()
+        # Bind the hot-path callables and levels once; write_pin then
+        # skips the module attribute lookups on every edge
+        self._write = module.gpio_write
+        self._HIGH = module.HIGH
+        self._LOW = module.LOW
+        # tx_pulse times the pulse in the kernel, so the caller is not on
+        # the hook for the LOW edge and sleep jitter never widens a pulse
+        self._tx_pulse = getattr(module, "tx_pulse", None)
+        self.hardware_timed = self._tx_pulse is not None
 
     def setup_pin(self, pin: int) -> None:
         if pin in self._initialized:
@@ -47,24 +60,57 @@ class LGPIOBackend:
 
         self._initialized.add(pin)
 
+    def write_pin(self, pin: int, high: bool) -> None:
+        self._write(self._chip_handle, pin, self._HIGH if high else self._LOW)
+
     def pulse_pin(self, pin: int, pulse_seconds: float) -> None:
-        write = self._lgpio.gpio_write
-        write(self._chip_handle, pin, self._lgpio.HIGH)
+        if self._tx_pulse is not None:
+            self._tx_pulse(
+                self._chip_handle, pin, int(pulse_seconds * 1e6), 0, 0, 1
+            )
+            return
+
+        self.write_pin(pin, True)
         time.sleep(pulse_seconds)
-        write(self._chip_handle, pin, self._lgpio.LOW)
+        self.write_pin(pin, False)
+
+
+class _PinRequest:
+    """A queued pin activation waiting for the GPIO worker."""
+
+    __slots__ = ("pin", "pulse_seconds", "done", "error")
+
+    def __init__(self, pin: int, pulse_seconds: float) -> None:
+        self.pin = pin
+        self.pulse_seconds = pulse_seconds
+        self.done = Event()
+        self.error: Optional[Exception] = None
 
 
 class GPIOService:
-    """Service class for GPIO operations."""
+    """Service class for GPIO operations.
+
+    Activations are funnelled through a single worker thread that drains
+    the request queue in small batches: concurrent pulses share one sleep
+    window instead of serializing behind the GPIO lock.
+    """
+
+    _MAX_BATCH = 8
+    _BATCH_WINDOW_SECONDS = 0.005
 
     def __init__(self) -> None:
         self._lock = Lock()
         self._backend = self._initialize_backend()
+        self._queue: "queue.Queue[_PinRequest]" = queue.Queue()
 
         if not self._backend:
             logger.warning("No GPIO backend could be initialized; GPIO operations are disabled.")
         else:
             logger.info("Using %s backend for GPIO operations.", self._backend.name)
+            self._worker = Thread(
+                target=self._worker_loop, daemon=True, name="GPIOWorker"
+            )
+            self._worker.start()
 
     def _initialize_backend(self) -> Optional[GPIOBackend]:
         """Initialize the lgpio backend if available."""
@@ -80,6 +126,61 @@ class GPIOService:
     def _initialize_lgpio(self) -> GPIOBackend:
         return LGPIOBackend(lgpio)
 
+    def _drain_batch(self) -> List[_PinRequest]:
+        """Block for one request, then gather more briefly up to the cap."""
+        batch = [self._queue.get()]
+        while len(batch) < self._MAX_BATCH:
+            try:
+                batch.append(self._queue.get(timeout=self._BATCH_WINDOW_SECONDS))
+            except queue.Empty:
+                break
+        return batch
+
+    def _activate_batch(self, batch: List[_PinRequest]) -> None:
+        """Pulse every pin in the batch with a single shared sleep window."""
+        with self._lock:
+            if getattr(self._backend, "hardware_timed", False):
+                # Hardware-timed pulses return at dispatch; the kernel
+                # timer drives the LOW edge, so no shared sleep is needed
+                for item in batch:
+                    try:
+                        self._backend.setup_pin(item.pin)
+                        self._backend.pulse_pin(item.pin, item.pulse_seconds)
+                    except Exception as err:
+                        item.error = err
+                return
+
+            for item in batch:
+                try:
+                    self._backend.setup_pin(item.pin)
+                    self._backend.write_pin(item.pin, True)
+                except Exception as err:
+                    item.error = err
+
+            time.sleep(max(item.pulse_seconds for item in batch))
+
+            for item in batch:
+                if item.error:
+                    continue
+                try:
+                    self._backend.write_pin(item.pin, False)
+                except Exception as err:
+                    item.error = err
+
+    def _worker_loop(self) -> None:
+        """Drain queued activations in batches until process exit."""
+        while True:
+            batch = self._drain_batch()
+            try:
+                self._activate_batch(batch)
+            except Exception as err:
+                for item in batch:
+                    if item.error is None:
+                        item.error = err
+            finally:
+                for item in batch:
+                    item.done.set()
+
     def activate_pin(self, pin: int, pulse_seconds: float = 0.3) -> None:
         """Activate a GPIO pin for a short pulse."""
         if not isinstance(pin, int):
@@ -89,9 +190,13 @@ class GPIOService:
         if not self._backend:
             raise RuntimeError("GPIO module is not available on this system.")
 
-        with self._lock:
-            self._backend.setup_pin(pin)
-            self._backend.pulse_pin(pin, pulse_seconds)
+        request = _PinRequest(pin, pulse_seconds)
+        self._queue.put(request)
+
+        if not request.done.wait(timeout=pulse_seconds + 1.0):
+            raise RuntimeError(f"Timed out waiting for GPIO activation of pin {pin}.")
+        if request.error:
+            raise request.error
 
 
 # Global service instance
@@ -2,6 +2,8 @@
 
 import os
 import logging
+import time
+from functools import cached_property
 from typing import List, Dict, Optional
 from kubernetes import client, config
 from kubernetes.client.rest import ApiException
@@ -14,13 +16,21 @@ logger = logging.getLogger(__name__)
 class JobStatusService:
     """Service to get job status from Kubernetes."""
 
+    # Dashboard polls arrive faster than pod state meaningfully changes;
+    # one second of staleness saves an API-server round trip per poll
+    _CACHE_TTL_SECONDS = 1.0
+
     def __init__(self):
-        self.core_v1 = None
         self.config = get_config()
-        self._init_kubernetes_client()
+        self._status_cache: Dict[str, tuple] = {}
+
+    @cached_property
+    def core_v1(self):
+        """Kubernetes client, built lazily on first status request.
 
-    def _init_kubernetes_client(self):
-        """Initialize Kubernetes client based on environment."""
+        Deferring the kubeconfig parse keeps it off the import path each
+        gunicorn worker pays when the module-level singleton is created.
+        """
         try:
             if os.getenv("KUBERNETES_SERVICE_HOST"):
                 config.load_incluster_config()
@@ -29,9 +39,10 @@ class JobStatusService:
                 config.load_kube_config()
                 logger.info("Loaded kubeconfig from local environment")
 
-            self.core_v1 = client.CoreV1Api()
+            return client.CoreV1Api()
         except Exception as e:
             logger.error(f"Failed to initialize Kubernetes client: {e}")
+            return None
 
     def get_all_job_statuses(self, namespace: Optional[str] = None) -> List[Dict]:
         """
@@ -49,16 +60,21 @@ class JobStatusService:
         if not self.core_v1:
             return statuses
 
+        cached = self._status_cache.get(namespace)
+        if cached and time.monotonic() - cached[0] < self._CACHE_TTL_SECONDS:
+            return [dict(status) for status in cached[1]]
+
         try:
+            # spec.schedulerName is a supported pod field selector, so the
+            # API server drops foreign-scheduler pods before serialization
+            # instead of this process filtering them after download
             pods = self.core_v1.list_namespaced_pod(
                 namespace=namespace,
                 label_selector="job-name",
+                field_selector="spec.schedulerName=llama-scheduler",
             )
 
             for pod in pods.items:
-                if pod.spec.scheduler_name != "llama-scheduler":
-                    continue
-
                 job_name = pod.metadata.labels.get("job-name", "")
                 node_name = pod.spec.node_name
                 phase = pod.status.phase
@@ -70,10 +86,12 @@ class JobStatusService:
                     "namespace": namespace,
                 })
 
+            self._status_cache[namespace] = (time.monotonic(), statuses)
+
         except ApiException as e:
             logger.error(f"Failed to get Kubernetes jobs: {e}")
 
-        return statuses
+        return [dict(status) for status in statuses]
 
 
 # Global service instance
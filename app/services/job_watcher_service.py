@@ -1,16 +1,29 @@
 """Background service to watch Kubernetes jobs and store results in SQLite."""
 
 import logging
+import queue
+import random
 import threading
+import time
 import json
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from typing import Optional
 from kubernetes import client, watch
+
+try:
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover - optional speedup
+    orjson = None
 from kubernetes.client.rest import ApiException
 
 from app.config.config import get_config
-from app.repositories.job_repository import job_repository
-from app.services.prometheus_service import prometheus_service
-from app.services.kubernetes_service import kubernetes_service
+# Module imports, not instance imports: these singletons are built via
+# module __getattr__, so resolving them here would load the kubeconfig
+# and construct the Prometheus session at import time. They are bound
+# when JobWatcherService itself is constructed (also lazily, below).
+from app.services import prometheus_service as prometheus_service_module
+from app.services import kubernetes_service as kubernetes_service_module
 from app.services.node_service import node_service
 
 logger = logging.getLogger(__name__)
@@ -19,6 +32,34 @@ logger = logging.getLogger(__name__)
 class JobWatcherService:
     """Service to watch Kubernetes jobs and persist results."""
 
+    # Workers draining completed-job events off the watch stream
+    _EVENT_WORKERS = 4
+
+    # The resync poll is only a bootstrap + watch-failure backstop (the
+    # watch already reconnects every 300s on its own), so it runs at a
+    # relaxed cadence; jitter stops replicas from re-listing in lockstep
+    _RESYNC_INTERVAL_SECONDS = 300
+    _RESYNC_JITTER_SECONDS = 30
+
+    # Jobs created by kubernetes_service carry this label, so the
+    # apiserver filters foreign jobs out of the list and watch responses
+    # instead of this service streaming and discarding them
+    _SCHEDULER_LABEL_SELECTOR = "scheduler=llama-scheduler"
+
+    # The llama.cpp JSON response is the last thing curl prints, so the
+    # kubelet only needs to ship the end of the log, not the megabytes
+    # of progress output that can precede it
+    _LOG_TAIL_LINES = 200
+
+    # Per-job resync work is kubelet + Prometheus HTTP, so a restart
+    # sync of N jobs fans out instead of paying the latencies serially
+    _SYNC_WORKERS = 8
+
+    # A job claimed by either the watch or the resync path is left alone
+    # by the other for this long, so overlapping observation of the same
+    # completion never duplicates the log fetch and Prometheus query
+    _PROCESSED_TTL_SECONDS = 600.0
+
     def __init__(self):
         self.config = get_config()
         self.core_v1 = None
@@ -26,15 +67,87 @@ class JobWatcherService:
         self.watcher_thread = None
         self.polling_thread = None
         self.should_stop = False
+        # Deferred import: the package __init__ re-exports the instance
+        # over the submodule name, so this is resolved here instead of
+        # at module import, which would open SQLite as a side effect
+        from app.repositories.job_repository import job_repository
+
         self.repository = job_repository
-        self.kubernetes_service = kubernetes_service
+        self.kubernetes_service = kubernetes_service_module.kubernetes_service
+        self.prometheus_service = prometheus_service_module.prometheus_service
         self.node_service = node_service
+        # In-memory job index maintained from watch events so list-style
+        # reads don't need a Kubernetes API round-trip per request
+        self._job_index = {}
+        self._job_index_lock = threading.Lock()
+        # Pod cache fed by a pod watch stream, keyed by job-name label;
+        # per-event pod lookups read it instead of list_namespaced_pod
+        self.pod_watcher_thread = None
+        self._pod_cache = {}
+        self._pod_cache_lock = threading.Lock()
+        # Completed jobs are handled on a small worker pool; the watch
+        # thread only enqueues, so a slow Prometheus query or log fetch
+        # never stalls delivery of later job events
+        self._event_queue = queue.Queue(maxsize=1024)
+        self._worker_threads = []
+        self._in_flight = set()
+        self._in_flight_lock = threading.Lock()
+        # Woken by the watcher when its stream fails, so the backup
+        # resync runs immediately instead of whenever its timer fires
+        self._wake = threading.Event()
+        # job_name -> monotonic claim time; entries expire after
+        # _PROCESSED_TTL_SECONDS (see _claim)
+        self._recently_processed = {}
+        # job UID -> scheduler name ("" when unset); a job's scheduler
+        # never changes, so repeat MODIFIED events skip the model
+        # attribute walk. Only the watch thread touches this dict.
+        self._job_scheduler_cache = {}
+
+    def _update_job_index(self, event_type: str, job) -> None:
+        """Keep the per-namespace job index in sync with watch events."""
+        namespace = job.metadata.namespace or self.config.DEFAULT_NAMESPACE
+        job_name = job.metadata.name
+
+        with self._job_index_lock:
+            namespace_index = self._job_index.setdefault(namespace, {})
+            if event_type == "DELETED":
+                namespace_index.pop(job_name, None)
+            else:
+                status = job.status
+                namespace_index[job_name] = {
+                    "job_name": job_name,
+                    "namespace": namespace,
+                    "active": status.active or 0,
+                    "succeeded": status.succeeded or 0,
+                    "failed": status.failed or 0,
+                    "start_time": (
+                        status.start_time.isoformat() if status.start_time else None
+                    ),
+                    "completion_time": (
+                        status.completion_time.isoformat()
+                        if status.completion_time
+                        else None
+                    ),
+                }
+
+    def get_jobs(self, namespace: Optional[str] = None) -> list:
+        """Return the cached job list for a namespace from watch events."""
+        namespace = namespace or self.config.DEFAULT_NAMESPACE
+        with self._job_index_lock:
+            return list(self._job_index.get(namespace, {}).values())
 
     def _parse_curl_output(self, logs: str) -> Optional[str]:
         """Parse curl output to extract JSON response, removing progress lines."""
         if not logs:
             return None
 
+        # Fast path: curl output normally ends with the JSON body after
+        # the last progress update, so one rsplit finds it without
+        # scanning every line
+        tail = logs.rsplit("\r", 1)[-1].strip()
+        if tail.startswith("{") and "\n" not in tail:
+            return tail
+
         # Curl progress output uses \r (carriage return) for updating the same line
         # Split by newlines and filter out lines with \r (progress lines)
         lines = logs.split("\n")
@@ -55,55 +168,113 @@ class JobWatcherService:
         json_str = "\n".join(json_lines)
         return json_str if json_str else logs
 
-    def _get_pod_info(self, job_name: str, namespace: str) -> tuple[Optional[str], Optional[str], Optional[str], Optional[str]]:
+    def _watch_pods(self):
+        """Maintain the job-name → pod cache from a pod watch stream."""
+        namespace = self.config.DEFAULT_NAMESPACE
+        w = watch.Watch()
+
+        while not self.should_stop:
+            try:
+                for event in w.stream(
+                    self.core_v1.list_namespaced_pod,
+                    namespace=namespace,
+                    label_selector="job-name",
+                    timeout_seconds=300,
+                ):
+                    if self.should_stop:
+                        break
+
+                    pod = event["object"]
+                    job_name = (pod.metadata.labels or {}).get("job-name")
+                    if not job_name:
+                        continue
+
+                    with self._pod_cache_lock:
+                        if event["type"] == "DELETED":
+                            self._pod_cache.pop(job_name, None)
+                        else:
+                            self._pod_cache[job_name] = pod
+            except Exception as e:
+                logger.error(f"Pod watcher error: {e}")
+                if not self.should_stop:
+                    time.sleep(5)
+
+    def _get_cached_pod(self, job_name: str, namespace: str):
+        """Return the pod for a job, preferring the watch-fed cache."""
+        with self._pod_cache_lock:
+            pod = self._pod_cache.get(job_name)
+        if pod is not None:
+            return pod
+
+        # A job's pod is unique, so cap the response at one item and let
+        # resource_version="0" serve it from the apiserver watch cache
+        # instead of a quorum read against etcd
+        pods = self.core_v1.list_namespaced_pod(
+            namespace=namespace,
+            label_selector=f"job-name={job_name}",
+            limit=1,
+            resource_version="0",
+        )
+        if not pods.items:
+            return None
+
+        pod = pods.items[0]
+        with self._pod_cache_lock:
+            self._pod_cache[job_name] = pod
+        return pod
+
+    def _get_pod_info(self, job_name: str, namespace: str) -> tuple[Optional[str], Optional[str], Optional[datetime], Optional[datetime]]:
         """
         Get pod information for a job.
-        
+
         Returns:
-            Tuple of (pod_name, node_name, started_at, completed_at)
+            Tuple of (pod_name, node_name, started_at, completed_at).
+            The timestamps are the tz-aware datetimes the Kubernetes
+            client already parsed; they are only rendered to strings at
+            the repository/Prometheus boundary.
         """
         try:
-            label_selector = f"job-name={job_name}"
-            pods = self.core_v1.list_namespaced_pod(
-                namespace=namespace, label_selector=label_selector
-            )
-
-            if not pods.items:
+            pod = self._get_cached_pod(job_name, namespace)
+            if pod is None:
                 return None, None, None, None
-
-            pod = pods.items[0]
             pod_name = pod.metadata.name
             node_name = pod.spec.node_name
-            
+
             # Get start and completion times from pod status
             started_at = None
             completed_at = None
-            
+
             if pod.status.container_statuses:
                 container_status = pod.status.container_statuses[0]
                 if container_status.state.terminated:
                     terminated = container_status.state.terminated
-                    if terminated.started_at:
-                        started_at = terminated.started_at.isoformat()
-                    if terminated.finished_at:
-                        completed_at = terminated.finished_at.isoformat()
-            
+                    started_at = terminated.started_at
+                    completed_at = terminated.finished_at
+
             return pod_name, node_name, started_at, completed_at
-            
+
         except ApiException as e:
             logger.warning(f"Could not get pod info for {job_name}: {e.reason}")
             return None, None, None, None
 
-    def _save_job_result(
+    def _build_job_record(
         self,
         job_name: str,
         namespace: str,
         status: str,
         logs: Optional[str] = None,
         pod_name: Optional[str] = None,
+        node_name: Optional[str] = None,
+        started_at: Optional[datetime] = None,
+        completed_at: Optional[datetime] = None,
         error_message: Optional[str] = None,
-    ):
-        """Save job result using the repository."""
+    ) -> dict:
+        """Assemble the job result record saved by the repository.
+
+        Callers that already resolved the pod (the event workers) pass
+        node_name/started_at/completed_at in; otherwise they are looked
+        up here.
+        """
         # Extract prompt and result from logs if available
         prompt = None
         result = None
@@ -111,78 +282,106 @@ class JobWatcherService:
             try:
                 clean_logs = self._parse_curl_output(logs)
 
-                # Parse JSON response from llama.cpp
-                log_json = json.loads(clean_logs)
+                # Parse JSON response from llama.cpp; orjson's SIMD
+                # parser is several times faster on these payloads
+                if orjson is not None:
+                    log_json = orjson.loads(clean_logs)
+                else:
+                    log_json = json.loads(clean_logs)
                 result = log_json.get("content", "").strip()
                 prompt = log_json.get("prompt", None)
 
                 if not result:
                     result = clean_logs
 
-            except json.JSONDecodeError:
+            except ValueError:
                 result = self._parse_curl_output(logs) or logs
 
-        # Get pod information (node, timestamps)
-        pod_name_fetched, node_name, started_at, completed_at = self._get_pod_info(job_name, namespace)
-        
-        # Use fetched pod_name if not provided
-        if not pod_name:
-            pod_name = pod_name_fetched
-        
-        # Calculate duration and power consumption
+        # Get pod information (node, timestamps) unless already resolved
+        if node_name is None:
+            pod_name_fetched, node_name, started_at, completed_at = self._get_pod_info(job_name, namespace)
+
+            # Use fetched pod_name if not provided
+            if not pod_name:
+                pod_name = pod_name_fetched
+
+
+        # The Kubernetes client hands us tz-aware datetimes, so the
+        # duration is plain arithmetic; the isoformat strings are built
+        # once here for the repository and Prometheus
         duration_seconds = None
         power_consumed_wh = None
-        
+        started_at_str = started_at.isoformat() if started_at else None
+        completed_at_str = completed_at.isoformat() if completed_at else None
+
         if started_at and completed_at and node_name:
             try:
-                from datetime import datetime
-                start_dt = datetime.fromisoformat(started_at.replace('Z', '+00:00'))
-                end_dt = datetime.fromisoformat(completed_at.replace('Z', '+00:00'))
-                duration_seconds = (end_dt - start_dt).total_seconds()
-                
+                duration_seconds = (completed_at - started_at).total_seconds()
+
                 # Query Prometheus for power consumption
-                power_consumed_wh = prometheus_service.get_power_consumption(
+                power_consumed_wh = self.prometheus_service.get_power_consumption(
                     node_name=node_name,
-                    start_time=started_at,
-                    end_time=completed_at
+                    start_time=started_at_str,
+                    end_time=completed_at_str
                 )
             except Exception as e:
                 logger.error(f"Failed to calculate duration/power for {job_name}: {e}")
 
-        # Use repository to save (token_count not passed, preserves initial value from job creation)
-        self.repository.save_job_result(
-            job_name=job_name,
-            namespace=namespace,
-            status=status,
-            prompt=prompt,
-            result=result,
-            pod_name=pod_name,
-            node_name=node_name,
-            started_at=started_at,
-            completed_at=completed_at,
-            duration_seconds=duration_seconds,
-            power_consumed_wh=power_consumed_wh,
-            error_message=error_message,
+        # token_count not included, preserves initial value from job creation
+        return {
+            "job_name": job_name,
+            "namespace": namespace,
+            "status": status,
+            "prompt": prompt,
+            "result": result,
+            "pod_name": pod_name,
+            "node_name": node_name,
+            "started_at": started_at_str,
+            "completed_at": completed_at_str,
+            "duration_seconds": duration_seconds,
+            "power_consumed_wh": power_consumed_wh,
+            "error_message": error_message,
+        }
+
+    def _save_job_result(
+        self,
+        job_name: str,
+        namespace: str,
+        status: str,
+        logs: Optional[str] = None,
+        pod_name: Optional[str] = None,
+        node_name: Optional[str] = None,
+        started_at: Optional[datetime] = None,
+        completed_at: Optional[datetime] = None,
+        error_message: Optional[str] = None,
+    ):
+        """Save job result using the repository."""
+        record = self._build_job_record(
+            job_name, namespace, status, logs=logs, pod_name=pod_name,
+            node_name=node_name, started_at=started_at,
+            completed_at=completed_at, error_message=error_message,
         )
+        self.repository.save_job_result(**record)
 
-    def _get_job_logs(self, job_name: str, namespace: str) -> Optional[str]:
+    def _get_job_logs(
+        self, job_name: str, namespace: str, pod_name: Optional[str] = None
+    ) -> Optional[str]:
         """Get logs from job's pod."""
         try:
-            # Find pod associated with job
-            label_selector = f"job-name={job_name}"
-            pods = self.core_v1.list_namespaced_pod(
-                namespace=namespace, label_selector=label_selector
-            )
-
-            if not pods.items:
-                return None
+            # Find pod associated with job, unless the caller already did
+            if pod_name is None:
+                pod = self._get_cached_pod(job_name, namespace)
+                if pod is None:
+                    return None
 
-            pod = pods.items[0]
-            pod_name = pod.metadata.name
+                pod_name = pod.metadata.name
 
-            # Get pod logs
+            # Get pod logs; the kubelet tails the file server-side so
+            # only the end of the log crosses the wire
             logs = self.core_v1.read_namespaced_pod_log(
-                name=pod_name, namespace=namespace
+                name=pod_name,
+                namespace=namespace,
+                tail_lines=self._LOG_TAIL_LINES,
             )
 
             return logs
@@ -191,6 +390,111 @@ class JobWatcherService:
             logger.warning(f"Could not get logs for {job_name}: {e.reason}")
             return None
 
+    def _claim(self, job_name: str) -> bool:
+        """Claim a completed job for processing.
+
+        Returns False if the job was already claimed within the TTL, so
+        the watch and resync paths never both fetch logs and query
+        Prometheus for the same completion. Expired entries are swept
+        here, keeping the dict bounded to recently active jobs.
+        """
+        now = time.monotonic()
+        with self._in_flight_lock:
+            claimed_at = self._recently_processed.get(job_name)
+            if claimed_at is not None and now - claimed_at < self._PROCESSED_TTL_SECONDS:
+                return False
+            self._recently_processed = {
+                name: ts
+                for name, ts in self._recently_processed.items()
+                if now - ts < self._PROCESSED_TTL_SECONDS
+            }
+            self._recently_processed[job_name] = now
+        return True
+
+    def _enqueue_completed_job(self, job_name: str, namespace: str, status: str) -> bool:
+        """Queue a completed job for a worker unless one already has it."""
+        if not self._claim(job_name):
+            return False
+        with self._in_flight_lock:
+            if job_name in self._in_flight:
+                return False
+            self._in_flight.add(job_name)
+
+        try:
+            self._event_queue.put((job_name, namespace, status), timeout=5)
+        except queue.Full:
+            with self._in_flight_lock:
+                self._in_flight.discard(job_name)
+                # Release the claim so the resync backstop can pick the
+                # job up instead of waiting out the TTL
+                self._recently_processed.pop(job_name, None)
+            logger.warning(
+                f"Event queue full, dropping {job_name} (polling sync will catch it)"
+            )
+            return False
+
+        return True
+
+    def _event_worker_loop(self):
+        """Drain queued completed-job events until the service stops."""
+        while not self.should_stop:
+            try:
+                job_name, namespace, status = self._event_queue.get(timeout=1)
+            except queue.Empty:
+                continue
+
+            try:
+                self._handle_completed_job(job_name, namespace, status)
+            except Exception as e:
+                logger.error(f"Error handling completed job {job_name}: {e}", exc_info=True)
+            finally:
+                with self._in_flight_lock:
+                    self._in_flight.discard(job_name)
+                self._event_queue.task_done()
+
+    def _handle_completed_job(self, job_name: str, namespace: str, status: str):
+        """Fetch logs, persist the result and annotate the node."""
+        # Resolve the pod once; the log fetch, saved row and node
+        # annotation all reuse the same answer
+        pod_name, node_name, started_at, completed_at = self._get_pod_info(
+            job_name, namespace
+        )
+        logs = self._get_job_logs(job_name, namespace, pod_name=pod_name)
+
+        if status == "succeeded":
+            self._save_job_result(
+                job_name=job_name,
+                namespace=namespace,
+                status="succeeded",
+                logs=logs,
+                pod_name=pod_name,
+                node_name=node_name,
+                started_at=started_at,
+                completed_at=completed_at,
+            )
+
+            try:
+                if node_name is not None and node_name != "None" and node_name != "":
+                    node_speed = self.node_service.get_node_speed(node_name)
+                    logger.info(f"Node '{node_name}' speed: {node_speed} tokens/second")
+                    self.kubernetes_service.node_annotator(node_name, "tokens-per-second", str(node_speed))
+                else:
+                    logger.debug(f"Skipping node annotation for {job_name}: node_name is {node_name}")
+            except Exception as e:
+                logger.warning(f"Failed to update node annotation for {job_name}: {e}")
+        else:
+            self._save_job_result(
+                job_name=job_name,
+                namespace=namespace,
+                status="failed",
+                logs=logs,
+                pod_name=pod_name,
+                node_name=node_name,
+                started_at=started_at,
+                completed_at=completed_at,
+                error_message="Job failed",
+            )
+
     def _sync_existing_jobs(self):
         """Sync existing completed jobs that may have been missed.
         
@@ -204,112 +508,154 @@ class JobWatcherService:
         try:
             logger.debug(f"Checking for completed jobs in namespace: {namespace}")
             
-            # List all jobs in the namespace
-            jobs = self.batch_v1.list_namespaced_job(namespace=namespace)
-            
-            synced_count = 0
+            # List only our jobs; the apiserver applies the label filter
+            jobs = self.batch_v1.list_namespaced_job(
+                namespace=namespace,
+                label_selector=self._SCHEDULER_LABEL_SELECTOR,
+            )
+
+            # One query answers "is it recorded, and what's missing" for
+            # every job, instead of a get_job_result round-trip per job
+            sync_state = self.repository.get_job_sync_state(namespace)
+
+            # First pass decides, without I/O, what each job needs; the
+            # actual kubelet/Prometheus round-trips then fan out across a
+            # small pool, and everything lands in one batched write
+            power_only = []    # (job_name, existing-row) pairs
+            full_fetch = []    # (job_name, status, error_message) triples
             for job in jobs.items:
                 job_name = job.metadata.name
-                
+
                 # Only care about jobs with our scheduler
                 scheduler_name = getattr(job.spec.template.spec, "scheduler_name", None)
                 if scheduler_name != "llama-scheduler":
                     continue
-                
+
+                # Skip jobs a watch worker is already processing
+                with self._in_flight_lock:
+                    if job_name in self._in_flight:
+                        continue
+
                 # Check if already in database
-                existing = self.repository.get_job_result(job_name, namespace)
-                
+                existing = sync_state.get(job_name)
+
                 # Check if job is completed
                 status = job.status
-                
+
                 if status.succeeded and status.succeeded > 0:
                     # If job exists but missing new fields, update it
                     if existing and (
-                        existing.get('node_name') is None or 
-                        existing.get('started_at') is None or 
+                        existing.get('node_name') is None or
+                        existing.get('started_at') is None or
                         existing.get('power_consumed_wh') is None
                     ):
-                        logger.info(f"Updating existing job with new fields: {job_name}")
-                        logs = self._get_job_logs(job_name, namespace)
-                        self._save_job_result(
-                            job_name=job_name,
-                            namespace=namespace,
-                            status="succeeded",
-                            logs=logs,
-                        )
-                        synced_count += 1
+                        if (
+                            existing.get('node_name') is not None
+                            and existing.get('started_at') is not None
+                            and existing.get('completed_at') is not None
+                        ):
+                            # Only the power figure is missing: re-query
+                            # Prometheus without refetching pod or logs
+                            if self._claim(job_name):
+                                power_only.append((job_name, existing))
+                            continue
+
+                        if self._claim(job_name):
+                            logger.info(f"Updating existing job with new fields: {job_name}")
+                            full_fetch.append((job_name, "succeeded", None))
                     elif not existing:
                         # New job, record it
-                        logger.info(f"Found unrecorded completed job: {job_name}")
-                        logs = self._get_job_logs(job_name, namespace)
-                        self._save_job_result(
-                            job_name=job_name,
-                            namespace=namespace,
-                            status="succeeded",
-                            logs=logs,
-                        )
-                        synced_count += 1
-                    
+                        if self._claim(job_name):
+                            logger.info(f"Found unrecorded completed job: {job_name}")
+                            full_fetch.append((job_name, "succeeded", None))
+
                 elif status.failed and status.failed > 0:
                     # If job exists but missing new fields, update it
                     if existing and (
-                        existing.get('node_name') is None or 
+                        existing.get('node_name') is None or
                         existing.get('started_at') is None
                     ):
-                        logger.info(f"Updating existing failed job with new fields: {job_name}")
-                        logs = self._get_job_logs(job_name, namespace)
-                        self._save_job_result(
-                            job_name=job_name,
-                            namespace=namespace,
-                            status="failed",
-                            logs=logs,
-                            error_message="Job failed",
-                        )
-                        synced_count += 1
+                        if self._claim(job_name):
+                            logger.info(f"Updating existing failed job with new fields: {job_name}")
+                            full_fetch.append((job_name, "failed", "Job failed"))
                     elif not existing:
                         # New job, record it
-                        logger.info(f"Found unrecorded failed job: {job_name}")
-                        logs = self._get_job_logs(job_name, namespace)
-                        self._save_job_result(
-                            job_name=job_name,
-                            namespace=namespace,
-                            status="failed",
-                            logs=logs,
-                            error_message="Job failed",
-                        )
-                        synced_count += 1
-            
-            if synced_count > 0:
-                logger.info(f"Synced {synced_count} completed jobs")
+                        if self._claim(job_name):
+                            logger.info(f"Found unrecorded failed job: {job_name}")
+                            full_fetch.append((job_name, "failed", "Job failed"))
+
+            def query_power(task):
+                # Re-query Prometheus; only write if it finally answers
+                job_name, existing = task
+                power = self.prometheus_service.get_power_consumption(
+                    node_name=existing['node_name'],
+                    start_time=existing['started_at'],
+                    end_time=existing['completed_at'],
+                )
+                if power is None:
+                    return None
+                return {
+                    "job_name": job_name,
+                    "namespace": namespace,
+                    "status": "succeeded",
+                    "power_consumed_wh": power,
+                }
+
+            def build_record(task):
+                job_name, status, error_message = task
+                logs = self._get_job_logs(job_name, namespace)
+                return self._build_job_record(
+                    job_name=job_name,
+                    namespace=namespace,
+                    status=status,
+                    logs=logs,
+                    error_message=error_message,
+                )
+
+            pending = []
+            if power_only or full_fetch:
+                with ThreadPoolExecutor(max_workers=self._SYNC_WORKERS) as executor:
+                    # Both map calls submit everything up front, so the
+                    # two kinds of work share the pool
+                    power_results = executor.map(query_power, power_only)
+                    full_results = executor.map(build_record, full_fetch)
+                    pending.extend(r for r in power_results if r is not None)
+                    pending.extend(full_results)
+
+            if pending:
+                self.repository.save_job_results_many(pending)
+                logger.info(f"Synced {len(pending)} completed jobs")
             
         except Exception as e:
             logger.error(f"Error syncing existing jobs: {e}", exc_info=True)
     
     def _polling_loop(self):
-        """Periodically poll for completed jobs as a backup to the watch mechanism.
-        
-        This ensures we don't miss jobs if the watch silently fails or times out.
-        Runs every 30 seconds to check for any completed jobs not yet in the database.
+        """Periodically resync completed jobs as a backup to the watch mechanism.
+
+        The watch handles the steady state, so each iteration waits on an
+        event rather than sleeping: a failing watcher wakes it for an
+        immediate resync, otherwise a full re-list only happens every few
+        minutes instead of every 30 seconds.
         """
-        import time
-        
-        logger.info("Starting polling loop for completed jobs")
-        
+        logger.info("Starting resync loop for completed jobs")
+
         while not self.should_stop:
             try:
-                # Sleep first to avoid immediate poll on startup (sync already ran)
-                time.sleep(30)  # Poll every 30 seconds
-                
+                # Wait first to avoid an immediate re-list on startup
+                # (the initial sync already ran)
+                timeout = self._RESYNC_INTERVAL_SECONDS + random.uniform(
+                    0, self._RESYNC_JITTER_SECONDS
+                )
+                self._wake.wait(timeout=timeout)
+                self._wake.clear()
+
                 if not self.should_stop:
                     self._sync_existing_jobs()
-                    
+
             except Exception as e:
-                logger.error(f"Error in polling loop: {e}", exc_info=True)
-                # Continue polling even if one iteration fails
-                if not self.should_stop:
-                    time.sleep(5)  # Brief pause before retry
-        
-        logger.info("Polling loop stopped")
+                logger.error(f"Error in resync loop: {e}", exc_info=True)
+
+        logger.info("Resync loop stopped")
 
     def _watch_jobs(self):
         """Watch Kubernetes jobs in the prompts namespace."""
@@ -318,76 +664,76 @@ class JobWatcherService:
 
         logger.info(f"Starting job watcher for namespace: {namespace}")
 
-        try:
-            # Use a timeout for the watch stream to force periodic reconnections
-            # This prevents silent watch failures and ensures we don't miss events
-            for event in w.stream(
-                self.batch_v1.list_namespaced_job,
-                namespace=namespace,
-                timeout_seconds=300,  # Reconnect every 5 minutes
-            ):
-                if self.should_stop:
-                    logger.info("Job watcher stopping...")
-                    break
-
-                event_type = event["type"]
-                job = event["object"]
-                job_name = job.metadata.name
-                node_name = self._get_pod_info(job_name, namespace)[1]
-
-                logger.debug(f"Job event: {event_type} - {job_name}")
-
-                # Only care about jobs with our scheduler
-                scheduler_name = getattr(job.spec.template.spec, "scheduler_name", None)
-                if scheduler_name != "llama-scheduler":
-                    continue
-
-                # Check if job completed (succeeded or failed)
-                status = job.status
-
-                if status.succeeded and status.succeeded > 0:
-                    logger.info(f"Job {job_name} succeeded, fetching logs...")
-                    logs = self._get_job_logs(job_name, namespace)
-                    self._save_job_result(
-                        job_name=job_name,
-                        namespace=namespace,
-                        status="succeeded",
-                        logs=logs,
-                    )
-                    
-                    try:
-                        _, node_name, _, _ = self._get_pod_info(job_name, namespace)
-                        if node_name is not None and node_name != "None" and node_name != "":
-                            node_speed = self.node_service.get_node_speed(node_name)
-                            logger.info(f"Node '{node_name}' speed: {node_speed} tokens/second")
-                            self.kubernetes_service.node_annotator(node_name, "tokens-per-second", str(node_speed))
-                        else:
-                            logger.debug(f"Skipping node annotation for {job_name}: node_name is {node_name}")
-                    except Exception as e:
-                        logger.warning(f"Failed to update node annotation for {job_name}: {e}")
-
-                elif status.failed and status.failed > 0:
-                    logger.info(f"Job {job_name} failed")
-                    logs = self._get_job_logs(job_name, namespace)
-                    self._save_job_result(
-                        job_name=job_name,
-                        namespace=namespace,
-                        status="failed",
-                        logs=logs,
-                        error_message="Job failed",
-                    )
-
-            # If we exit the loop normally (timeout), restart the watcher
-            if not self.should_stop:
-                logger.info("Watch stream ended normally, reconnecting...")
-                self._watch_jobs()
+        # Reconnects loop here rather than recursing or spawning a new
+        # thread, so thread count and stack depth stay flat no matter how
+        # long the process runs
+        while not self.should_stop:
+            try:
+                # Use a timeout for the watch stream to force periodic reconnections
+                # This prevents silent watch failures and ensures we don't miss events
+                for event in w.stream(
+                    self.batch_v1.list_namespaced_job,
+                    namespace=namespace,
+                    label_selector=self._SCHEDULER_LABEL_SELECTOR,
+                    timeout_seconds=300,  # Reconnect every 5 minutes
+                ):
+                    if self.should_stop:
+                        logger.info("Job watcher stopping...")
+                        break
+
+                    event_type = event["type"]
+                    job = event["object"]
+                    job_name = job.metadata.name
+
+                    logger.debug(f"Job event: {event_type} - {job_name}")
+
+                    # Only care about jobs with our scheduler; the
+                    # answer is cached by UID so only the first event
+                    # per job pays the generated-model attribute walk
+                    uid = job.metadata.uid
+                    scheduler_name = self._job_scheduler_cache.get(uid)
+                    if scheduler_name is None:
+                        try:
+                            scheduler_name = job.spec.template.spec.scheduler_name
+                        except AttributeError:
+                            scheduler_name = None
+                        # Cache "" for jobs without a scheduler so the
+                        # miss itself is remembered
+                        self._job_scheduler_cache[uid] = scheduler_name or ""
+
+                    if event_type == "DELETED":
+                        self._job_scheduler_cache.pop(uid, None)
+
+                    if scheduler_name != "llama-scheduler":
+                        continue
+
+                    self._update_job_index(event_type, job)
+
+                    # Check if job completed (succeeded or failed); the
+                    # blocking log/Prometheus/SQLite work runs on the workers
+                    status = job.status
+
+                    if status.succeeded and status.succeeded > 0:
+                        logger.info(f"Job {job_name} succeeded, queueing for processing...")
+                        self._enqueue_completed_job(job_name, namespace, "succeeded")
+
+                    elif status.failed and status.failed > 0:
+                        logger.info(f"Job {job_name} failed")
+                        self._enqueue_completed_job(job_name, namespace, "failed")
+
+                # Normal stream end (timeout): loop straight back into a
+                # fresh stream
+                if not self.should_stop:
+                    logger.debug("Watch stream ended normally, reconnecting...")
 
-        except Exception as e:
-            logger.error(f"Job watcher error: {e}", exc_info=True)
-            if not self.should_stop:
-                # Restart watcher after error
-                logger.info("Restarting job watcher in 5 seconds...")
-                threading.Timer(5.0, self._watch_jobs).start()
+            except Exception as e:
+                logger.error(f"Job watcher error: {e}", exc_info=True)
+                if not self.should_stop:
+                    # A broken watch may have dropped events; wake the
+                    # resync loop to re-list instead of waiting out its
+                    # timer, then back off briefly before reconnecting
+                    self._wake.set()
+                    time.sleep(5)
 
     def start(self):
         """Start the background job watcher."""
@@ -421,13 +767,30 @@ class JobWatcherService:
             logger.error(f"Failed to sync existing jobs: {e}")
 
         self.should_stop = False
-        
+
+        # Start the worker pool draining completed-job events
+        self._worker_threads = []
+        for i in range(self._EVENT_WORKERS):
+            worker = threading.Thread(
+                target=self._event_worker_loop, daemon=True, name=f"JobEventWorker-{i}"
+            )
+            worker.start()
+            self._worker_threads.append(worker)
+        logger.info("Job event workers started")
+
         # Start the watch-based watcher (fast response when it works)
         self.watcher_thread = threading.Thread(
             target=self._watch_jobs, daemon=True, name="JobWatcher"
         )
         self.watcher_thread.start()
         logger.info("Job watcher (event-based) started")
+
+        # Start the pod watcher feeding the job-name → pod cache
+        self.pod_watcher_thread = threading.Thread(
+            target=self._watch_pods, daemon=True, name="PodWatcher"
+        )
+        self.pod_watcher_thread.start()
+        logger.info("Pod watcher (cache) started")
         
         # Start the polling-based backup (ensures we never miss jobs)
         self.polling_thread = threading.Thread(
@@ -439,7 +802,9 @@ class JobWatcherService:
     def stop(self):
         """Stop the background job watcher and poller."""
         self.should_stop = True
-        
+        # Release the resync loop from its timed wait
+        self._wake.set()
+
         if self.watcher_thread:
             self.watcher_thread.join(timeout=5)
             
@@ -449,5 +814,16 @@ class JobWatcherService:
         logger.info("Job watcher and poller stopped")
 
 
-# Global service instance
-job_watcher_service = JobWatcherService()
+# Global service instance, created lazily on first access (same scheme
+# as kubernetes_service); constructing it resolves the repository and
+# service singletons, so it must not happen as an import side effect
+_job_watcher_service: Optional[JobWatcherService] = None
+
+
+def __getattr__(name):
+    if name == "job_watcher_service":
+        global _job_watcher_service
+        if _job_watcher_service is None:
+            _job_watcher_service = JobWatcherService()
+        return _job_watcher_service
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
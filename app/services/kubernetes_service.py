@@ -1,31 +1,67 @@
 """Kubernetes service layer for job operations."""
 
+import atexit
 import os
 import logging
 from typing import Dict, Optional
 from kubernetes import client, config
 from kubernetes.client.rest import ApiException
+from urllib3.util.retry import Retry
 import uuid
 import json
 
+try:
+    import orjson  # type: ignore
+except ModuleNotFoundError:
+    orjson = None
+
 from app.models.job import (
     JobCreateRequest,
     JobResponse,
 )
 from app.config.config import get_config
-from app.repositories.job_repository import job_repository
 
 logger = logging.getLogger(__name__)
 
 
+def _raise_api_error(e: ApiException, action: str, status_messages: Optional[Dict[int, str]] = None):
+    """Translate an ApiException into the service's user-facing Exception.
+
+    status_messages maps specific HTTP status codes to tailored messages;
+    anything unmapped is logged and becomes the generic apiserver error.
+    Keeps each method's handler down to a single call instead of the
+    same log/branch/raise block repeated per method.
+    """
+    if status_messages:
+        message = status_messages.get(e.status)
+        if message is not None:
+            raise Exception(message)
+
+    logger.error("%s: %s", action, e)
+    raise Exception(f"Kubernetes API error: {e.reason}")
+
+
 class KubernetesService:
     """Service class for Kubernetes operations."""
 
+    # Constant manifest pieces, hoisted so per-job builds only assemble
+    # the request-specific parts
+    _JOB_IMAGE = "curlimages/curl:8.9.1"
+    _CURL_COMMAND_TEMPLATE = (
+        "curl --request POST "
+        "--url http://$HOST_IP:8080/completion "
+        '--header "Content-Type: application/json" '
+        "--data '{}'"
+    )
+
     def __init__(self):
         """Initialize the Kubernetes service."""
+        self.api_client = None
         self.batch_v1 = None
         self.core_v1 = None
         self.config = get_config()
+        # Resolved once; every public method reads it on entry
+        self._default_namespace = self.config.DEFAULT_NAMESPACE
         self._init_kubernetes_client()
 
     def _init_kubernetes_client(self):
@@ -40,8 +76,28 @@ class KubernetesService:
                 config.load_kube_config()
                 logger.info("Loaded kubeconfig from local environment")
 
-            self.batch_v1 = client.BatchV1Api()
-            self.core_v1 = client.CoreV1Api()
+            # Share one ApiClient across the API groups so concurrent
+            # requests reuse pooled TLS connections instead of
+            # re-handshaking per call
+            configuration = client.Configuration.get_default_copy()
+            configuration.connection_pool_maxsize = self.config.K8S_CONNECTION_POOL_MAXSIZE
+            # Retry transient apiserver hiccups with backoff, but only on
+            # idempotent reads — a retried POST/DELETE could double-create
+            # or double-delete a job. raise_on_status stays off so the
+            # client still maps the final status to an ApiException.
+            configuration.retries = Retry(
+                total=3,
+                backoff_factor=0.2,
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=frozenset(["GET", "HEAD"]),
+                raise_on_status=False,
+            )
+            self.api_client = client.ApiClient(configuration)
+            self.batch_v1 = client.BatchV1Api(self.api_client)
+            self.core_v1 = client.CoreV1Api(self.api_client)
+            # Tear down the pooled connections (and the ApiClient's
+            # internal thread pool) when the process exits
+            atexit.register(self.api_client.close)
         except Exception as e:
             logger.error(f"Failed to initialize Kubernetes client: {e}")
             raise
@@ -56,22 +112,21 @@ class KubernetesService:
             "temperature": job_request.temperature,
         }
 
-        json_str = json.dumps(json_data)
+        if orjson is not None:
+            json_str = orjson.dumps(json_data).decode()
+        else:
+            json_str = json.dumps(json_data)
 
-        return (
-            f"curl --request POST "
-            f"--url http://$HOST_IP:8080/completion "
-            f'--header "Content-Type: application/json" '
-            f"--data '{json_str}'"
-        )
+        return self._CURL_COMMAND_TEMPLATE.format(json_str)
 
     def _build_container_spec(self, job_request: JobCreateRequest) -> Dict:
         """Build the container specification."""
-        container_name = str(uuid.uuid4())[:8]
+        # hex avoids building the dashed string form just to slice it
+        container_name = uuid.uuid4().hex[:8]
 
         return {
             "name": container_name,
-            "image": "curlimages/curl:8.9.1",
+            "image": self._JOB_IMAGE,
             "env": [
                 {"name": "PROMPT", "value": job_request.prompt},
                 {
@@ -103,7 +158,13 @@ class KubernetesService:
         return {
             "apiVersion": "batch/v1",
             "kind": "Job",
-            "metadata": {"name": job_request.name},
+            # The scheduler label lets the job watcher filter server-side
+            # with a label selector instead of streaming every job in the
+            # namespace and checking spec.template.spec.schedulerName
+            "metadata": {
+                "name": job_request.name,
+                "labels": {"scheduler": "llama-scheduler"},
+            },
             "spec": {
                 "template": {
                     "metadata": {"labels": labels},
@@ -118,7 +179,7 @@ class KubernetesService:
         if not self.batch_v1:
             raise Exception("Kubernetes client not initialized")
 
-        namespace = job_request.namespace or self.config.DEFAULT_NAMESPACE
+        namespace = job_request.namespace or self._default_namespace
         job_manifest = self._build_job_manifest(job_request)
 
         try:
@@ -129,6 +190,11 @@ class KubernetesService:
             logger.info(f"Created job {job_request.name} in namespace {namespace}")
 
             # Immediately save job to database with initial state
+            # Deferred import: the repository singleton is built via
+            # module __getattr__, and this module must stay importable
+            # without opening SQLite
+            from app.repositories.job_repository import job_repository
+
             job_repository.save_job_result(
                 job_name=response.metadata.name,
                 namespace=response.metadata.namespace,
@@ -147,13 +213,14 @@ class KubernetesService:
                 creation_timestamp=response.metadata.creation_timestamp.isoformat(),
             )
         except ApiException as e:
-            logger.error(f"Failed to create job {job_request.name}: {e}")
-            if e.status == 409:
-                raise Exception(
-                    f"Job '{job_request.name}' already exists in namespace '{namespace}'. "
-                    "Use a different name or delete the existing job first."
-                )
-            raise Exception(f"Kubernetes API error: {e.reason}")
+            _raise_api_error(
+                e,
+                f"Failed to create job {job_request.name}",
+                {
+                    409: f"Job '{job_request.name}' already exists in namespace '{namespace}'. "
+                         "Use a different name or delete the existing job first."
+                },
+            )
 
     def get_job_logs(
         self, job_name: str, namespace: Optional[str] = None
@@ -162,14 +229,15 @@ class KubernetesService:
         if not self.core_v1 or not self.batch_v1:
             raise Exception("Kubernetes client not initialized")
 
-        namespace = namespace or self.config.DEFAULT_NAMESPACE
+        namespace = namespace or self._default_namespace
 
         try:
 
-            # Get pods associated with this job
+            # Get pods associated with this job; only the first pod is
+            # read below, so don't ask the apiserver for more than one
             label_selector = f"job-name={job_name}"
             pods = self.core_v1.list_namespaced_pod(
-                namespace=namespace, label_selector=label_selector
+                namespace=namespace, label_selector=label_selector, limit=1
             )
 
             if not pods.items:
@@ -226,12 +294,11 @@ class KubernetesService:
                 raise
 
         except ApiException as e:
-            if e.status == 404:
-                raise Exception(
-                    f"Job '{job_name}' not found in namespace '{namespace}'"
-                )
-            logger.error(f"Failed to get logs for job {job_name}: {e}")
-            raise Exception(f"Kubernetes API error: {e.reason}")
+            _raise_api_error(
+                e,
+                f"Failed to get logs for job {job_name}",
+                {404: f"Job '{job_name}' not found in namespace '{namespace}'"},
+            )
         
     def node_annotator(self, node_name: str, annotation_key: str, annotation_value: str) -> None:
         """Annotate a Kubernetes node with a given key-value pair."""
@@ -249,9 +316,19 @@ class KubernetesService:
             self.core_v1.patch_node(name=node_name, body=body)
             logger.info(f"Annotated node {node_name} with {annotation_key}: {annotation_value}")
         except ApiException as e:
-            logger.error(f"Failed to annotate node {node_name}: {e}")
-            raise Exception(f"Kubernetes API error: {e.reason}")
+            _raise_api_error(e, f"Failed to annotate node {node_name}")
+
+
+# Global service instance, created lazily so importing this module does
+# not force a kubeconfig load and TLS setup until the service is used
+# (same scheme as app.repositories.job_repository)
+_kubernetes_service: Optional[KubernetesService] = None
 
 
-# Global service instance
-kubernetes_service = KubernetesService()
+def __getattr__(name):
+    if name == "kubernetes_service":
+        global _kubernetes_service
+        if _kubernetes_service is None:
+            _kubernetes_service = KubernetesService()
+        return _kubernetes_service
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
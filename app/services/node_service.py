@@ -1,5 +1,4 @@
 import logging
-from app.repositories.job_repository import job_repository
 from app.repositories.node_repository import node_repository
 
 
@@ -10,9 +9,16 @@ class NodeService:
 
     def __init__(self):
         """Initialize the Node service."""
-        self.job_repository = job_repository
         self.node_repository = node_repository
 
+    @property
+    def job_repository(self):
+        # Resolved on first use rather than at import: the singleton is
+        # built via module __getattr__, and importing it at the top
+        # would open SQLite while this module is being imported
+        from app.repositories.job_repository import job_repository
+        return job_repository
+
     def get_node_speed(self, node_name: str) -> float:
         """Retrieve the speed of the specified node."""
         node_speed = self.job_repository.get_node_speed(node_name)
@@ -34,18 +40,17 @@ class NodeService:
         """
 
         node_speeds = self.job_repository.get_all_node_speeds()
-        
+
         all_nodes = self.node_repository.get_all_nodes()
-        
-        # Similarly assigning 0.0 for nodes without job history
-        result = {}
-        for node in all_nodes:
-            node_name = node['node_name']
-            if node_name in node_speeds:
-                result[node_name] = node_speeds[node_name]
-            else:
-                result[node_name] = 0.0
-        
+
+        # Similarly assigning 0.0 for nodes without job history; built
+        # with bulk dict operations instead of a per-node Python loop.
+        # Speeds for nodes no longer registered are dropped, as before.
+        result = dict.fromkeys((node['node_name'] for node in all_nodes), 0.0)
+        result.update(
+            (name, speed) for name, speed in node_speeds.items() if name in result
+        )
+
         return result
     
 
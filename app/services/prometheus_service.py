@@ -1,7 +1,18 @@
 """Service for querying Prometheus metrics."""
 
+import atexit
+import calendar
 import logging
+import re
+import time
 import requests
+from urllib3.util.retry import Retry
+
+try:
+    import orjson  # type: ignore
+except ModuleNotFoundError:
+    orjson = None
+
 from typing import Optional
 from datetime import datetime
 from app.config.config import get_config
@@ -10,23 +21,76 @@ from app.repositories.node_repository import node_repository
 
 logger = logging.getLogger(__name__)
 
+# Kubernetes timestamps arrive as 'YYYY-MM-DDTHH:MM:SSZ' (optionally with
+# fractional seconds); matching that shape directly skips the string
+# rewrite + fromisoformat round-trip paid twice per power query
+_ISO_UTC_RE = re.compile(
+    r'^(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2})(\.\d+)?Z$'
+)
+
+# One shared session keeps the TCP connection to Prometheus alive between
+# queries instead of paying connect+close on every lookup. Transient
+# gateway errors are retried at the adapter with a short backoff.
+_session = requests.Session()
+_adapter = requests.adapters.HTTPAdapter(
+    pool_connections=1,
+    pool_maxsize=4,
+    max_retries=Retry(total=2, backoff_factor=0.1, status_forcelist=(502, 503, 504)),
+)
+_session.mount("http://", _adapter)
+_session.mount("https://", _adapter)
+atexit.register(_session.close)
+
 
 class PrometheusService:
     """Service for querying Prometheus metrics."""
 
+    # A completed job's (node, start, end) window never changes, so a
+    # real power figure can be cached for good; bound the cache so
+    # long-running processes don't accumulate one entry per historical
+    # job forever. A None result can also mean the query itself failed
+    # (connection error, unresolved node IP), so it only lives briefly —
+    # long enough to stop resync storms from hammering Prometheus, short
+    # enough that the backfill path can still get an answer later.
+    _POWER_CACHE_MAX = 512
+    _POWER_FAILURE_TTL_SECONDS = 300.0
+
+    # Node IPs change rarely, so hits live for an hour; misses are cached
+    # briefly too, so a node absent from the table doesn't cost a database
+    # round-trip on every power query until it gets registered
+    _NODE_IP_TTL_SECONDS = 3600.0
+    _NODE_IP_NEGATIVE_TTL_SECONDS = 60.0
+
+    # The or-combined query text is constant apart from the label values,
+    # so the template is assembled once here and formatted per call. The
+    # variants cover the instance label shapes seen across exporters:
+    # IP:port, exact IP:9100, bare IP, then node-name fallbacks.
+    _POWER_QUERY_TEMPLATE = ' or '.join([
+        'avg_over_time(jetson_pom_5v_in_watts{{instance=~"{ip}:.*"}}[{dur}s])',
+        'avg_over_time(jetson_pom_5v_in_watts{{instance="{ip}:9100"}}[{dur}s])',
+        'avg_over_time(jetson_pom_5v_in_watts{{instance="{ip}"}}[{dur}s])',
+        'avg_over_time(jetson_pom_5v_in_watts{{node="{node}"}}[{dur}s])',
+        'avg_over_time(jetson_pom_5v_in_watts{{instance="{node}"}}[{dur}s])',
+    ])
+    _RECORDING_RULE_TEMPLATE = '{rule}{{instance=~"{ip}:.*"}} or {rule}{{node="{node}"}}'
+
     def __init__(self):
         self.config = get_config()
         self.prometheus_url = getattr(
             self.config, "PROMETHEUS_URL", "http://prometheus-server.default.svc.cluster.local"
         )
-        # Cache for node name to IP mappings
+        # Cache for node name to IP mappings: name -> (expires_at, ip)
+        # where ip is None for cached "not found" answers
         self._node_ip_cache = {}
+        # Cache for power queries, keyed (node_name, start_time, end_time)
+        self._power_cache = {}
 
     def _get_node_ip(self, node_name: str) -> Optional[str]:
         """Get the IP address for a node name from the nodes table."""
-        # Check cache first
-        if node_name in self._node_ip_cache:
-            return self._node_ip_cache[node_name]
+        # Check cache first (both found and not-found answers are cached)
+        cached = self._node_ip_cache.get(node_name)
+        if cached and time.monotonic() < cached[0]:
+            return cached[1]
 
         try:
             # Query the nodes table
@@ -34,19 +98,32 @@ class PrometheusService:
 
             if node_info and node_info.get('ip_address'):
                 ip_address = node_info['ip_address']
-                self._node_ip_cache[node_name] = ip_address
+                self._node_ip_cache[node_name] = (
+                    time.monotonic() + self._NODE_IP_TTL_SECONDS, ip_address
+                )
                 logger.debug("Found IP %s for node %s in database", ip_address, node_name)
                 return ip_address
 
             logger.warning("Node %s not found in database", node_name)
+            self._node_ip_cache[node_name] = (
+                time.monotonic() + self._NODE_IP_NEGATIVE_TTL_SECONDS, None
+            )
             return None
 
         except Exception as e:
             logger.error("Failed to get IP for node %s: %s", node_name, e)
             return None
 
-    def _parse_timestamp(self, timestamp_str: str) -> float:
+    def _parse_timestamp(self, timestamp_str: str) -> Optional[float]:
         """Parse ISO timestamp to Unix timestamp."""
+        m = _ISO_UTC_RE.match(timestamp_str)
+        if m:
+            seconds = calendar.timegm((
+                int(m[1]), int(m[2]), int(m[3]),
+                int(m[4]), int(m[5]), int(m[6]), 0, 0, 0,
+            ))
+            return seconds + float(m[7]) if m[7] else float(seconds)
+
         try:
             dt = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
             return dt.timestamp()
@@ -71,12 +148,44 @@ class PrometheusService:
         Returns:
             Power consumed in watt-hours, or None if query fails
         """
+        cache_key = (node_name, start_time, end_time)
+        cached = self._power_cache.get(cache_key)
+        if cached is not None:
+            expires_at, value = cached
+            if expires_at is None or time.monotonic() < expires_at:
+                return value
+
+        power_consumed_wh = self._query_power_consumption(
+            node_name, start_time, end_time
+        )
+
+        # Real answers never expire (the window is historical); a None
+        # may be a transient failure, so it only suppresses re-queries
+        # for a short while rather than pinning the miss forever
+        if len(self._power_cache) >= self._POWER_CACHE_MAX:
+            self._power_cache.pop(next(iter(self._power_cache)))
+        expires_at = (
+            None
+            if power_consumed_wh is not None
+            else time.monotonic() + self._POWER_FAILURE_TTL_SECONDS
+        )
+        self._power_cache[cache_key] = (expires_at, power_consumed_wh)
+
+        return power_consumed_wh
+
+    def _query_power_consumption(
+        self,
+        node_name: str,
+        start_time: str,
+        end_time: str,
+    ) -> Optional[float]:
+        """Issue the PromQL query behind get_power_consumption."""
         try:
             # Parse timestamps
             start_ts = self._parse_timestamp(start_time)
             end_ts = self._parse_timestamp(end_time)
 
-            if not start_ts or not end_ts:
+            if start_ts is None or end_ts is None:
                 return None
 
             duration_seconds = end_ts - start_ts
@@ -91,53 +200,53 @@ class PrometheusService:
                 logger.warning("Could not resolve IP for node %s", node_name)
                 return None
 
-            # Query Prometheus for average power during the time range
-            # The instance label in Prometheus uses IP:port format
-            metric_queries = [
-                # Try with IP:port (most likely format)
-                f'avg_over_time(jetson_pom_5v_in_watts{{instance=~"{node_ip}:.*"}}[{int(duration_seconds)}s])',
-                # Try exact IP:9100 (common exporter port)
-                f'avg_over_time(jetson_pom_5v_in_watts{{instance="{node_ip}:9100"}}[{int(duration_seconds)}s])',
-                # Try just IP
-                f'avg_over_time(jetson_pom_5v_in_watts{{instance="{node_ip}"}}[{int(duration_seconds)}s])',
-                # Fallback to node name attempts
-                f'avg_over_time(jetson_pom_5v_in_watts{{node="{node_name}"}}[{int(duration_seconds)}s])',
-                f'avg_over_time(jetson_pom_5v_in_watts{{instance="{node_name}"}}[{int(duration_seconds)}s])',
-            ]
+            # Query Prometheus for average power during the time range;
+            # the label-shape variants are or-combined in the class-level
+            # template so one HTTP round-trip replaces up to five serial
+            # ones
+            window = int(duration_seconds)
+            recording_rule = getattr(self.config, "POWER_RECORDING_RULE", None)
+            if recording_rule:
+                # Pre-aggregated write-side; evaluation cost no longer
+                # scales with the window length
+                query = self._RECORDING_RULE_TEMPLATE.format(
+                    rule=recording_rule, ip=node_ip, node=node_name
+                )
+            else:
+                query = self._POWER_QUERY_TEMPLATE.format(
+                    ip=node_ip, dur=window, node=node_name
+                )
 
             results = None
-            successful_query = None
-
-            for query in metric_queries:
-                try:
-                    params = {
-                        'query': query,
-                        'time': end_ts  # Query at end time
-                    }
-
-                    response = requests.get(
-                        f"{self.prometheus_url}/api/v1/query",
-                        params=params,
-                        timeout=10
-                    )
-
-                    response.raise_for_status()
+            successful_query = query
+
+            try:
+                params = {
+                    'query': query,
+                    'time': end_ts  # Query at end time
+                }
+
+                response = _session.get(
+                    f"{self.prometheus_url}/api/v1/query",
+                    params=params,
+                    timeout=10
+                )
+
+                response.raise_for_status()
+                if orjson:
+                    data = orjson.loads(response.content)
+                else:
                     data = response.json()
 
-                    if data['status'] == 'success':
-                        query_results = data.get('data', {}).get('result', [])
-                        if query_results:
-                            results = query_results
-                            successful_query = query
-                            break
-                except Exception as e:
-                    logger.debug("Query failed: %s - %s", query, e)
-                    continue
+                if data['status'] == 'success':
+                    results = data.get('data', {}).get('result', [])
+            except Exception as e:
+                logger.debug("Query failed: %s - %s", query, e)
 
             if not results:
                 logger.warning(
                     "No power data found for %s between %s and %s. "
-                    "Tried queries: %s", node_name, start_time, end_time, ', '.join(metric_queries[:2])
+                    "Query: %s", node_name, start_time, end_time, query
                 )
                 return None
 
@@ -163,5 +272,15 @@ class PrometheusService:
             return None
 
 
-# Global service instance
-prometheus_service = PrometheusService()
+# Global service instance, created lazily on first access (same scheme
+# as kubernetes_service) so importing this module stays cheap
+_prometheus_service: Optional[PrometheusService] = None
+
+
+def __getattr__(name):
+    if name == "prometheus_service":
+        global _prometheus_service
+        if _prometheus_service is None:
+            _prometheus_service = PrometheusService()
+        return _prometheus_service
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,12 @@
+#!/bin/sh
+# Run the API under gunicorn with gevent workers so slow Kubernetes/SSH
+# calls overlap instead of serializing on Werkzeug's dev server.
+export GEVENT_MONKEY_PATCH="${GEVENT_MONKEY_PATCH:-true}"
+
+exec gunicorn \
+    --config gunicorn.conf.py \
+    --workers "${WORKERS:-4}" \
+    --worker-class gevent \
+    --worker-connections 1000 \
+    --bind "${HOST:-0.0.0.0}:${PORT:-5000}" \
+    "app.app:create_app()"
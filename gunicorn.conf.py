@@ -0,0 +1,30 @@
+"""Gunicorn configuration used by entrypoint.sh.
+
+Assigns each worker a stable WORKER_INDEX so create_app() can start the
+background job watcher in exactly one worker (see app/app.py). Slots are
+recycled when a worker exits, so a respawned worker takes over the dead
+worker's index and index 0 — and with it the watcher — always exists.
+"""
+import os
+
+
+def on_starting(server):
+    server._worker_slots = list(range(server.cfg.workers))
+
+
+def pre_fork(server, worker):
+    # Runs in the master: hand the lowest free slot to the new worker
+    worker._slot = server._worker_slots.pop(0)
+
+
+def post_fork(server, worker):
+    # Runs in the worker: publish the slot before the app imports
+    os.environ["WORKER_INDEX"] = str(worker._slot)
+
+
+def child_exit(server, worker):
+    # Runs in the master: return the slot for the replacement worker
+    slot = getattr(worker, "_slot", None)
+    if slot is not None and slot not in server._worker_slots:
+        server._worker_slots.append(slot)
+        server._worker_slots.sort()
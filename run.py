@@ -20,11 +20,16 @@ def main():
     logger.info(f"Debug mode: {config.DEBUG}")
     logger.info(f"Swagger documentation available at: http://{config.HOST}:{config.PORT}/docs/")
     
-    # Run the application
+    # Run the application. Production deployments go through
+    # entrypoint.sh (gunicorn with gevent workers); this entry point is
+    # for local runs, where threaded=True at least lets slow
+    # Kubernetes/Prometheus calls overlap instead of serializing every
+    # request behind one Werkzeug thread.
     app.run(
         host=config.HOST,
         port=config.PORT,
-        debug=config.DEBUG
+        debug=config.DEBUG,
+        threaded=True,
     )
 
 